@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-from collections import deque
+import time
+from collections import OrderedDict, deque
 from typing import Deque, Dict, List, Tuple
 
 from ..config import ConversationConfig
@@ -10,6 +11,9 @@ from .ollama_client import OllamaClient
 
 _LOGGER = get_logger(__name__)
 
+# (channel id, history before the question, normalised question)
+_CacheKey = Tuple[int, Tuple[Tuple[str, str], ...], str]
+
 
 class ConversationManager:
     """Maintains per-channel conversation history and interfaces with Ollama."""
@@ -19,6 +23,12 @@ class ConversationManager:
         self._client = client
         self._conversations: Dict[int, Deque[Tuple[str, str]]] = {}
         self._locks: Dict[int, asyncio.Lock] = {}
+        # Scoped to the channel and keyed on its full history plus the normalised question, so a
+        # cached reply is only reused where Ollama would have been sent exactly the same conversation.
+        self._reply_cache: OrderedDict[_CacheKey, Tuple[float, str]] = OrderedDict()
+        # Questions already waiting on a reply, keyed on (channel id, normalised question); a
+        # duplicate in the same channel shares the first request.
+        self._inflight: Dict[Tuple[int, str], asyncio.Future[str]] = {}
 
     def _get_history(self, channel_id: int) -> Deque[Tuple[str, str]]:
         if channel_id not in self._conversations:
@@ -33,26 +43,86 @@ class ConversationManager:
     async def reset(self, channel_id: int) -> None:
         async with self._get_lock(channel_id):
             self._conversations.pop(channel_id, None)
+            for key in [key for key in self._reply_cache if key[0] == channel_id]:
+                del self._reply_cache[key]
             _LOGGER.debug("Conversation reset for channel %s", channel_id)
 
     async def generate_reply(self, channel_id: int, user_message: str) -> str:
-        lock = self._get_lock(channel_id)
-        async with lock:
+        question = " ".join(user_message.lower().split())
+        # Coalesce before taking the channel lock: a duplicate sent while the first copy is still
+        # queued or generating shares its answer instead of becoming a turn of its own.
+        inflight_key = (channel_id, question)
+        pending = self._inflight.get(inflight_key)
+        if pending is not None:
+            _LOGGER.debug("Joining in-flight request for channel %s", channel_id)
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The request we joined was cancelled; issue our own below.
+
+        pending = asyncio.get_running_loop().create_future()
+        self._inflight[inflight_key] = pending
+        try:
+            reply = await self._generate_in_channel(channel_id, user_message, question)
+        except asyncio.CancelledError:
+            pending.cancel()
+            raise
+        except Exception as exc:
+            pending.set_exception(exc)
+            # Mark the exception as retrieved so an unshared failure is not reported twice.
+            pending.exception()
+            raise
+        finally:
+            if self._inflight.get(inflight_key) is pending:
+                del self._inflight[inflight_key]
+        pending.set_result(reply)
+        return reply
+
+    async def _generate_in_channel(self, channel_id: int, user_message: str, question: str) -> str:
+        async with self._get_lock(channel_id):
             history = self._get_history(channel_id)
+            cache_key = (channel_id, tuple(history), question)
             history.append(("user", user_message))
-            messages = self._build_messages(history)
-            _LOGGER.debug("Sending conversation with %d messages", len(messages))
-            reply = await self._client.generate(
-                messages,
-                max_tokens=self._config.max_tokens,
-                temperature=self._config.temperature,
-                top_p=self._config.top_p,
-                presence_penalty=self._config.presence_penalty,
-                frequency_penalty=self._config.frequency_penalty,
-            )
+
+            reply = self._get_cached_reply(cache_key)
+            if reply is not None:
+                _LOGGER.debug("Reusing cached reply for channel %s", channel_id)
+            else:
+                messages = self._build_messages(history)
+                _LOGGER.debug("Sending conversation with %d messages", len(messages))
+                reply = await self._client.generate(
+                    messages,
+                    max_tokens=self._config.max_tokens,
+                    temperature=self._config.temperature,
+                    top_p=self._config.top_p,
+                    presence_penalty=self._config.presence_penalty,
+                    frequency_penalty=self._config.frequency_penalty,
+                )
+                self._store_cached_reply(cache_key, reply)
             history.append(("assistant", reply))
             return reply
 
+    def _get_cached_reply(self, key: _CacheKey) -> str | None:
+        entry = self._reply_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, reply = entry
+        if time.monotonic() - stored_at >= self._config.reply_cache_ttl_seconds:
+            del self._reply_cache[key]
+            return None
+        self._reply_cache.move_to_end(key)
+        return reply
+
+    def _store_cached_reply(self, key: _CacheKey, reply: str) -> None:
+        if self._config.reply_cache_size <= 0 or not reply:
+            return
+        self._reply_cache[key] = (time.monotonic(), reply)
+        self._reply_cache.move_to_end(key)
+        while len(self._reply_cache) > self._config.reply_cache_size:
+            self._reply_cache.popitem(last=False)
+
     def _build_messages(self, history: Deque[Tuple[str, str]]) -> List[Dict[str, str]]:
         messages: List[Dict[str, str]] = []
         if self._config.system_prompt:
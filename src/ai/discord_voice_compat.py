@@ -46,6 +46,10 @@ _LOGGER = logging.getLogger(__name__)
 
 _RecordingCallback = Callable[[Sink, Any], Any]
 
+# Fixed RTP header: version/flags, payload type, sequence, timestamp, SSRC.
+_RTP_HEADER_SIZE = 12
+_SILENCE_SAMPLE = struct.pack("<h", 0)
+
 
 if opus is not None and not hasattr(opus, "DecodeManager"):
     class _CompatDecodeManager(threading.Thread):
@@ -328,8 +332,11 @@ def ensure_voice_recording_support() -> None:
                     _LOGGER.exception("Recording completion callback raised in %s", log_context)
 
     def _unpack_audio(self: discord.VoiceClient, data: bytes) -> None:
-        if len(data) < 2:
+        # Truncated datagrams cannot carry a full RTP header; drop them here
+        # rather than letting ``RawData`` fail (and log a traceback) on them.
+        if len(data) < _RTP_HEADER_SIZE:
             return
+        # Only the payload type is needed, and a single byte index is the cheapest way to read it.
         if 200 <= data[1] <= 204:
             return
         if getattr(self, "paused", False):
@@ -361,7 +368,7 @@ def ensure_voice_recording_support() -> None:
 
         silence_frames = max(0, int(silence))
         if silence_frames:
-            packet.decoded_data = struct.pack("<h", 0) * silence_frames * opus._OpusStruct.CHANNELS + packet.decoded_data
+            packet.decoded_data = _SILENCE_SAMPLE * silence_frames * opus._OpusStruct.CHANNELS + packet.decoded_data
 
         while packet.ssrc not in self.ws.ssrc_map:
             time.sleep(0.05)
@@ -5,6 +5,7 @@ from io import BufferedIOBase, BytesIO
 from pathlib import Path
 from typing import BinaryIO, Union
 
+import numpy as np
 from faster_whisper import WhisperModel
 
 from ..config import STTConfig
@@ -12,6 +13,8 @@ from ..logging_utils import get_logger
 
 _LOGGER = get_logger(__name__)
 
+AudioSource = Union[Path, str, bytes, np.ndarray, BinaryIO, BufferedIOBase, BytesIO]
+
 
 class SpeechToText:
     def __init__(self, config: STTConfig) -> None:
@@ -29,24 +32,37 @@ class SpeechToText:
             compute_type=config.compute_type,
         )
 
-    async def transcribe(self, audio_source: Union[Path, str, BinaryIO, BufferedIOBase, BytesIO]) -> str:
+    async def transcribe(self, audio_source: AudioSource) -> str:
+        """Transcribe a file path, encoded audio stream/bytes, or decoded samples.
+
+        ``numpy`` arrays must already hold mono float32 samples at 16 kHz; they
+        are handed to Whisper as-is, skipping its container decode and copy.
+        """
+
         path: Path | None = None
         stream: BinaryIO | BufferedIOBase | BytesIO | None = None
+        samples: np.ndarray | None = None
 
         if isinstance(audio_source, (str, Path)):
             path = Path(audio_source)
             if not path.exists():
                 raise FileNotFoundError(f"Audio file for transcription not found: {path}")
+        elif isinstance(audio_source, np.ndarray):
+            samples = audio_source
+        elif isinstance(audio_source, bytes):
+            # BytesIO shares the immutable buffer instead of copying it.
+            stream = BytesIO(audio_source)
         elif hasattr(audio_source, "read"):
             stream = audio_source  # type: ignore[assignment]
         else:
-            raise TypeError("audio_source must be a path-like object or a binary stream")
+            raise TypeError("audio_source must be a path-like object, bytes, a numpy array, or a binary stream")
 
         result = await self._loop.run_in_executor(
             None,
             self._transcribe_sync,
             path,
             stream,
+            samples,
         )
         return result
 
@@ -54,9 +70,12 @@ class SpeechToText:
         self,
         audio_path: Path | None,
         audio_stream: BinaryIO | BufferedIOBase | BytesIO | None,
+        audio_samples: np.ndarray | None = None,
     ) -> str:
         if audio_path is not None:
-            audio_input: Union[str, BinaryIO, BufferedIOBase, BytesIO] = str(audio_path)
+            audio_input: Union[str, np.ndarray, BinaryIO, BufferedIOBase, BytesIO] = str(audio_path)
+        elif audio_samples is not None:
+            audio_input = audio_samples
         elif audio_stream is not None:
             try:
                 audio_stream.seek(0)
@@ -64,7 +83,7 @@ class SpeechToText:
                 _LOGGER.warning("Audio stream is not seekable; transcription accuracy may be affected.")
             audio_input = audio_stream
         else:
-            raise ValueError("Either audio_path or audio_stream must be provided for transcription")
+            raise ValueError("Either audio_path, audio_stream or audio_samples must be provided for transcription")
 
         segments, _ = self._model.transcribe(
             audio_input,
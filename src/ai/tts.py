@@ -1,10 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-import time
-import wave
-from pathlib import Path
-from typing import Optional
+from typing import Iterator
 
 try:  # pragma: no cover - heavy import
     from kokoro import KPipeline  # type: ignore
@@ -28,56 +25,49 @@ _SAMPLE_RATE_HZ = 24_000
 
 class TextToSpeech:
     def __init__(self, config: KokoroConfig) -> None:
-        if config.format.lower() != "wav":
-            raise ValueError("Kokoro currently supports only WAV output. Set format to 'wav' in the config.")
         self._config = config
-        output_dir = Path(config.output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
         self._loop = asyncio.get_running_loop()
         _LOGGER.info("Initializing Kokoro pipeline with voice %s", config.voice)
         lang_code = self._resolve_lang_code(config.lang_code)
         self._pipeline = KPipeline(lang_code=lang_code)
 
-    async def synthesize(self, text: str, filename: Optional[str] = None) -> Path:
+    @property
+    def sample_rate(self) -> int:
+        return _SAMPLE_RATE_HZ
+
+    async def synthesize_pcm(self, text: str) -> np.ndarray:
+        """Render ``text`` to mono int16 samples at :attr:`sample_rate` without touching disk."""
+
         if not text:
             raise ValueError("Cannot synthesize empty text")
-        path = await self._loop.run_in_executor(
+        samples = await self._loop.run_in_executor(
             None,
-            self._synthesize_sync,
+            self._render_sync,
             text,
-            filename,
         )
-        return path
-
-    def _synthesize_sync(self, text: str, filename: Optional[str]) -> Path:
-        output_dir = Path(self._config.output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        file_stem = filename or f"tts_{int(time.time())}"
-        output_path = output_dir / f"{file_stem}.{self._config.format}"
-        segments_written = 0
-        with wave.open(str(output_path), "wb") as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)  # 16-bit audio
-            wav_file.setframerate(_SAMPLE_RATE_HZ)
-
-            for result in self._pipeline(
-                text,
-                voice=self._config.voice,
-                speed=self._config.speed,
-            ):
-                audio = result.audio
-                if audio is None:
-                    continue
-                audio = audio.detach().cpu().numpy()
-                audio = np.clip(audio, -1.0, 1.0)
-                wav_file.writeframes((audio * 32767.0).astype(np.int16).tobytes())
-                segments_written += 1
-
-        if segments_written == 0:
+        return samples
+
+    def _render_sync(self, text: str) -> np.ndarray:
+        segments = list(self._iter_segments(text))
+        if not segments:
             raise RuntimeError("Kokoro TTS produced no audio for the requested text")
 
-        _LOGGER.debug("Generated speech saved to %s (%d segment%s)", output_path, segments_written, "s" if segments_written != 1 else "")
-        return output_path
+        samples = segments[0] if len(segments) == 1 else np.concatenate(segments)
+        _LOGGER.debug("Generated %d sample(s) of speech (%d segment%s)", samples.shape[0], len(segments), "s" if len(segments) != 1 else "")
+        return samples
+
+    def _iter_segments(self, text: str) -> Iterator[np.ndarray]:
+        for result in self._pipeline(
+            text,
+            voice=self._config.voice,
+            speed=self._config.speed,
+        ):
+            audio = result.audio
+            if audio is None:
+                continue
+            audio = audio.detach().cpu().numpy()
+            audio = np.clip(audio, -1.0, 1.0)
+            yield (audio * 32767.0).astype(np.int16)
 
     @staticmethod
     def _resolve_lang_code(configured_code: str) -> str:
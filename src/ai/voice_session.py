@@ -3,18 +3,26 @@ from __future__ import annotations
 import asyncio
 import audioop
 import inspect
+import logging
 import wave
 from contextlib import closing, suppress
+from functools import lru_cache
 from io import BytesIO
 import time
-from pathlib import Path
 from typing import Any, Awaitable, Callable, Dict, Optional
 
 import discord
+import numpy as np
 from discord.ext import commands
+from numpy.lib.stride_tricks import sliding_window_view
 
 from .discord_voice_compat import ensure_voice_recording_support
 
+try:  # pragma: no cover - optional dependency resolution
+    import soxr
+except ImportError:  # pragma: no cover - falls back to audioop.ratecv
+    soxr = None  # type: ignore[assignment]
+
 try:  # pragma: no cover - optional dependency resolution
     from discord import sinks as discord_sinks
 except (ImportError, AttributeError):  # pragma: no cover - handled at runtime
@@ -30,11 +38,13 @@ except (ImportError, AttributeError):  # pragma: no cover - handled at runtime
 if voice_recv_sinks is not None:  # pragma: no cover - exercised via integration tests
 
     class _VoiceRecvBufferSink(voice_recv_sinks.AudioSink):
-        """Collect PCM frames per user and expose them as WAV byte streams."""
+        """Collect raw PCM frames per user without wrapping them in a WAV container."""
 
-        _CHANNELS = voice_recv_sinks.WaveSink.CHANNELS
-        _SAMPLE_WIDTH = voice_recv_sinks.WaveSink.SAMPLE_WIDTH
-        _SAMPLE_RATE = voice_recv_sinks.WaveSink.SAMPLING_RATE
+        pcm_format = (
+            voice_recv_sinks.WaveSink.SAMPLING_RATE,
+            voice_recv_sinks.WaveSink.CHANNELS,
+            voice_recv_sinks.WaveSink.SAMPLE_WIDTH,
+        )
 
         def __init__(self) -> None:
             super().__init__()
@@ -72,14 +82,7 @@ if voice_recv_sinks is not None:  # pragma: no cover - exercised via integration
                     continue
 
                 start_time = self._start_times.get(user_id, 0.0)
-                wav_stream = BytesIO()
-                with closing(wave.open(wav_stream, "wb")) as wav_out:
-                    wav_out.setnchannels(self._CHANNELS)
-                    wav_out.setsampwidth(self._SAMPLE_WIDTH)
-                    wav_out.setframerate(self._SAMPLE_RATE)
-                    wav_out.writeframes(pcm_bytes)
-                wav_stream.seek(0)
-                audio_payloads.append((start_time, user, wav_stream.getvalue()))
+                audio_payloads.append((start_time, user, pcm_bytes))
 
             return audio_payloads
 
@@ -97,10 +100,25 @@ _LOGGER = get_logger(__name__)
 
 TranscriptionCallback = Callable[[discord.abc.User, str], Awaitable[None]]
 
+# (sample rate, channels, sample width) of the PCM produced by Discord's Opus decoder.
+_DISCORD_PCM_FORMAT = (48000, 2, 2)
+
+
+@lru_cache(maxsize=None)
+def _decimation_taps(factor: int) -> np.ndarray:
+    """Return a Hamming-windowed sinc low-pass filter for integer-factor decimation."""
+
+    num_taps = 8 * factor + 1
+    cutoff = 0.45 / factor
+    offsets = np.arange(num_taps) - (num_taps - 1) / 2
+    taps = 2 * cutoff * np.sinc(2 * cutoff * offsets) * np.hamming(num_taps)
+    return (taps / taps.sum()).astype(np.float32)
+
 
 class VoiceSession:
     _NORMALISED_SAMPLE_RATE = 16000
     _NORMALISED_CHANNELS = 1
+    _WAV_READ_CHUNK_FRAMES = 16384
 
     def __init__(self, stt: SpeechToText, tts: TextToSpeech) -> None:
         self._stt = stt
@@ -108,6 +126,9 @@ class VoiceSession:
         self._active_recordings: Dict[int, asyncio.Task[None]] = {}
         self._listener_tasks: Dict[int, asyncio.Task[None]] = {}
         self._connection_locks: Dict[int, asyncio.Lock] = {}
+        self._opus_loaded = False
+        # Whether guild.change_voice_state accepts self_mute/self_deaf; learned on the first call.
+        self._voice_state_flags_supported = True
 
     def _voice_key(self, voice_client: discord.VoiceClient) -> int:
         guild = getattr(voice_client, "guild", None)
@@ -121,8 +142,13 @@ class VoiceSession:
     async def _ensure_voice_reception(self, voice_client: discord.VoiceClient) -> None:
         """Make sure the bot is not self-deafened or muted in the channel."""
 
-        guild = getattr(voice_client, "guild", None)
-        channel = getattr(voice_client, "channel", None)
+        # Connected clients always expose these; bind them once since this runs
+        # before every listening window in continuous mode.
+        try:
+            guild = voice_client.guild
+            channel = voice_client.channel
+        except AttributeError:
+            return
         if guild is None or channel is None:
             return
 
@@ -132,11 +158,21 @@ class VoiceSession:
         if callable(change_state):
             result: Any | None = None
             try:
-                result = change_state(channel=channel, self_mute=False, self_deaf=False)
-            except TypeError:
-                try:
+                if self._voice_state_flags_supported:
+                    result = change_state(channel=channel, self_mute=False, self_deaf=False)
+                else:
                     result = change_state(channel=channel)
-                except Exception:  # pragma: no cover - network side effects
+            except TypeError:
+                if self._voice_state_flags_supported:
+                    # Older libraries reject the flags; remember that instead of failing every call.
+                    self._voice_state_flags_supported = False
+                    try:
+                        result = change_state(channel=channel)
+                    except Exception:  # pragma: no cover - network side effects
+                        _LOGGER.exception(
+                            "Failed to update voice state for channel %s", getattr(channel, "id", "unknown")
+                        )
+                else:  # pragma: no cover - network side effects
                     _LOGGER.exception(
                         "Failed to update voice state for channel %s", getattr(channel, "id", "unknown")
                     )
@@ -166,8 +202,10 @@ class VoiceSession:
                 pass
 
         if isinstance(channel, discord.StageChannel):  # pragma: no branch - network effect
-            bot_member = getattr(guild, "me", None)
-            voice_state = getattr(bot_member, "voice", None) if bot_member else None
+            try:
+                voice_state = guild.me.voice
+            except AttributeError:
+                voice_state = None
             if voice_state is not None and getattr(voice_state, "suppressed", False):
                 request_to_speak = getattr(channel, "request_to_speak", None)
                 if callable(request_to_speak):
@@ -355,17 +393,7 @@ class VoiceSession:
 
         await self._ensure_voice_reception(voice_client)
 
-        opus_module = getattr(discord, "opus", None)
-        try:
-            opus_loaded = bool(opus_module and opus_module.is_loaded())
-        except Exception:  # pragma: no cover - best effort safety
-            opus_loaded = True
-
-        if not opus_loaded:
-            raise RuntimeError(
-                "Cannot start listening because the native Opus library is not loaded. "
-                "Install 'pynacl' (or ensure the discord.py voice extra is installed) and restart the bot."
-            )
+        self._ensure_opus_loaded()
 
         _LOGGER.info(
             "Starting voice capture in channel %s for up to %.1f seconds",
@@ -519,6 +547,26 @@ class VoiceSession:
         except asyncio.CancelledError:
             pass
 
+    def _ensure_opus_loaded(self) -> None:
+        # The library cannot be unloaded once loaded, so only the first
+        # successful probe is needed; continuous listening calls this per window.
+        if self._opus_loaded:
+            return
+
+        opus_module = getattr(discord, "opus", None)
+        try:
+            opus_loaded = bool(opus_module and opus_module.is_loaded())
+        except Exception:  # pragma: no cover - best effort safety
+            opus_loaded = True
+
+        if not opus_loaded:
+            raise RuntimeError(
+                "Cannot start listening because the native Opus library is not loaded. "
+                "Install 'pynacl' (or ensure the discord.py voice extra is installed) and restart the bot."
+            )
+
+        self._opus_loaded = True
+
     def _create_wave_sink(self) -> Any:
         if voice_recv_sinks is not None:
             return _VoiceRecvBufferSink()
@@ -529,13 +577,14 @@ class VoiceSession:
                 "or a Discord library that bundles discord.sinks to enable audio capture."
             )
 
-        wave_sink = getattr(discord_sinks, "WaveSink", None)
-        if wave_sink is None:
+        # PCMSink hands back the decoder output as-is, sparing a WAV encode and re-parse.
+        sink_class = getattr(discord_sinks, "PCMSink", None) or getattr(discord_sinks, "WaveSink", None)
+        if sink_class is None:
             raise RuntimeError(
                 "discord.sinks.WaveSink is unavailable. Update your Discord library or install "
                 "'discord-ext-voice-recv' to continue."
             )
-        return wave_sink()
+        return sink_class()
 
     def _validate_voice_permissions(self, channel: Any) -> None:
         guild = getattr(channel, "guild", None)
@@ -691,13 +740,21 @@ class VoiceSession:
             sink.cleanup()
 
     def _diagnose_channel_silence(self, voice_client: Any) -> None:
+        # This runs after every silent window in continuous-listen mode, so
+        # skip walking the member list entirely when nothing would be logged.
+        if not _LOGGER.isEnabledFor(logging.WARNING):
+            return
+
+        describe_participants = _LOGGER.isEnabledFor(logging.INFO)
+
         channel = getattr(voice_client, "channel", None)
         if channel is None:
             return
 
         members = list(getattr(channel, "members", []) or [])
         if not members:
-            _LOGGER.info("No other participants are present in %s; there may be nobody to listen to.", channel)
+            if describe_participants:
+                _LOGGER.info("No other participants are present in %s; there may be nobody to listen to.", channel)
             return
 
         guild = getattr(channel, "guild", None)
@@ -732,8 +789,9 @@ class VoiceSession:
             if not flags:
                 flags.append("active")
 
-            display_name = getattr(member, "display_name", None) or getattr(member, "name", member)
-            participant_descriptions.append(f"{display_name} ({', '.join(flags)})")
+            if describe_participants:
+                display_name = getattr(member, "display_name", None) or getattr(member, "name", member)
+                participant_descriptions.append(f"{display_name} ({', '.join(flags)})")
 
             if not getattr(member, "bot", False):
                 non_bot_members.append(member)
@@ -754,11 +812,16 @@ class VoiceSession:
             )
 
     async def _process_sink(self, sink: Any, on_transcription: TranscriptionCallback) -> None:
-        buffered_audio: list[tuple[float, Any, bytes]] = []
+        buffered_audio: list[tuple[float, Any, bytes | memoryview]] = []
+        pcm_format: tuple[int, int, int] | None = None
 
         if voice_recv_sinks is not None and isinstance(sink, _VoiceRecvBufferSink):
             buffered_audio.extend(sink.iter_audio())
+            pcm_format = sink.pcm_format
         else:
+            pcm_sink = getattr(discord_sinks, "PCMSink", None) if discord_sinks is not None else None
+            if pcm_sink is not None and isinstance(sink, pcm_sink):
+                pcm_format = _DISCORD_PCM_FORMAT
             audio_items = getattr(getattr(sink, "audio_data", None), "items", None)
             if callable(audio_items):
                 for user, audio in audio_items():
@@ -767,14 +830,15 @@ class VoiceSession:
 
                     start_time = getattr(audio, "start_time", 0.0)
                     audio_file = audio.file
-                    audio_bytes: bytes | None = None
+                    audio_bytes: bytes | memoryview | None = None
 
-                    if hasattr(audio_file, "getvalue"):
+                    if hasattr(audio_file, "getbuffer"):
+                        # A memoryview over the sink's buffer avoids getvalue()'s full copy.
                         try:
-                            audio_bytes = audio_file.getvalue()
+                            audio_bytes = audio_file.getbuffer()
                         except Exception:  # pragma: no cover - defensive guard
                             _LOGGER.exception(
-                                "Failed to read buffered audio via getvalue() for user %s", user
+                                "Failed to read buffered audio via getbuffer() for user %s", user
                             )
                             audio_bytes = None
 
@@ -800,7 +864,7 @@ class VoiceSession:
         if not buffered_audio:
             voice_client = getattr(sink, "vc", None) or getattr(sink, "voice_client", None)
             state_details: list[str] = []
-            if voice_client is not None:
+            if voice_client is not None and _LOGGER.isEnabledFor(logging.INFO):
                 if getattr(voice_client, "self_deaf", False):
                     state_details.append("voice client is currently self-deafened")
                 if getattr(voice_client, "self_mute", False):
@@ -825,43 +889,57 @@ class VoiceSession:
             self._diagnose_channel_silence(voice_client)
             return
 
-        for _, user, audio_bytes in buffered_audio:
-            stream = self._normalise_audio_stream(audio_bytes, source_user=user)
-            _LOGGER.debug("Transcribing audio captured from user %s", user)
-            transcript = await self._stt.transcribe(stream)
-            if transcript:
-                _LOGGER.info("Live transcription from %s: %s", user, transcript)
-                await on_transcription(user, transcript)
-            else:
-                _LOGGER.debug("No transcript produced for user %s", user)
+        try:
+            # Decoding and resampling are CPU-bound; run every speaker's buffer on worker threads at once.
+            prepared_audio = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        self._prepare_transcription_audio,
+                        audio_bytes,
+                        source_user=user,
+                        pcm_format=pcm_format,
+                    )
+                    for _, user, audio_bytes in buffered_audio
+                )
+            )
+        finally:
+            # Release views over the sink buffers so the sink can resize or close them on cleanup.
+            for _, _, audio_bytes in buffered_audio:
+                if isinstance(audio_bytes, memoryview):
+                    # A worker abandoned by cancellation may still hold an export; GC releases it later.
+                    with suppress(BufferError):
+                        audio_bytes.release()
+
+        # Queue every transcription up front so later speakers are decoded while earlier
+        # transcripts are being handled, but still deliver results in speaking order.
+        transcriptions = [asyncio.ensure_future(self._stt.transcribe(audio)) for audio in prepared_audio]
+        try:
+            for (_, user, _), transcription in zip(buffered_audio, transcriptions):
+                _LOGGER.debug("Transcribing audio captured from user %s", user)
+                transcript = await transcription
+                if transcript:
+                    _LOGGER.info("Live transcription from %s: %s", user, transcript)
+                    await on_transcription(user, transcript)
+                else:
+                    _LOGGER.debug("No transcript produced for user %s", user)
+        finally:
+            for transcription in transcriptions:
+                transcription.cancel()
 
-    async def speak(self, voice_client: discord.VoiceClient, text: str) -> Optional[Path]:
-        audio_path = await self._tts.synthesize(text)
+    async def speak(self, voice_client: discord.VoiceClient, text: str) -> None:
+        samples = await self._tts.synthesize_pcm(text)
+        # Feed Discord's PCM format straight to the encoder instead of spawning FFmpeg per reply.
+        pcm = await asyncio.to_thread(self._to_playback_pcm, samples, self._tts.sample_rate)
         if voice_client.is_playing():
             voice_client.stop()
 
-        audio_source = discord.FFmpegPCMAudio(str(audio_path))
+        audio_source = discord.PCMAudio(BytesIO(pcm))
 
         def after_playback(error: Optional[Exception]) -> None:
             if error:
-                _LOGGER.error("FFmpeg playback error: %s", error)
-
-            try:
-                audio_source.cleanup()
-            except Exception:  # pragma: no cover - cleanup best effort
-                _LOGGER.exception("Failed to cleanup audio source for %s", audio_path)
-
-            try:
-                audio_path.unlink(missing_ok=True)
-            except PermissionError:
-                _LOGGER.warning(
-                    "Unable to remove synthesized audio file %s because it is still in use", audio_path
-                )
-            except Exception:  # pragma: no cover - cleanup best effort
-                _LOGGER.exception("Failed to remove synthesized audio file %s", audio_path)
+                _LOGGER.error("Speech playback error: %s", error)
 
         voice_client.play(audio_source, after=after_playback)
-        return audio_path
 
     def stop_speaking(self, voice_client: discord.VoiceClient) -> bool:
         """Stop any active voice playback.
@@ -877,17 +955,18 @@ class VoiceSession:
         return False
 
     def _log_voice_channel_details(self, voice_client: discord.VoiceClient) -> None:
-        channel = getattr(voice_client, "channel", None)
-        if channel is None:
+        try:
+            channel = voice_client.channel
+            channel_id = channel.id
+            bitrate = channel.bitrate
+            user_limit = channel.user_limit
+            rtc_region = channel.rtc_region
+        except AttributeError:
             return
 
-        bitrate = getattr(channel, "bitrate", None)
-        user_limit = getattr(channel, "user_limit", None)
-        rtc_region = getattr(channel, "rtc_region", None)
-
         _LOGGER.debug(
             "Voice channel diagnostics for %s: bitrate=%s, user_limit=%s, region=%s",
-            getattr(channel, "id", channel),
+            channel_id,
             bitrate if bitrate is not None else "unknown",
             user_limit if user_limit not in (None, 0) else "unlimited",
             rtc_region or "automatic",
@@ -902,9 +981,11 @@ class VoiceSession:
             )
 
     def _configure_encoder_bitrate(self, voice_client: discord.VoiceClient) -> None:
-        channel = getattr(voice_client, "channel", None)
-        encoder = getattr(voice_client, "encoder", None)
-        bitrate = getattr(channel, "bitrate", None) if channel is not None else None
+        try:
+            encoder = voice_client.encoder
+            channel = voice_client.channel
+        except AttributeError:
+            return
 
         if encoder is None:
             return
@@ -916,6 +997,11 @@ class VoiceSession:
             )
             return
 
+        try:
+            bitrate = channel.bitrate
+        except AttributeError:
+            return
+
         if not isinstance(bitrate, int) or bitrate <= 0:
             return
 
@@ -934,69 +1020,138 @@ class VoiceSession:
                 channel,
             )
 
-    def _normalise_audio_stream(self, audio_bytes: bytes, *, source_user: Any | None = None) -> BytesIO:
-        stream = BytesIO(audio_bytes)
+    @staticmethod
+    def _to_mono_int16(frames: bytes, sample_width: int, channels: int) -> np.ndarray:
+        """Convert interleaved PCM frames to mono int16 samples in a single pass."""
+
+        if sample_width == 2:
+            samples = np.frombuffer(frames, dtype="<i2")
+        elif sample_width == 1:
+            # 8-bit WAV data is unsigned and centred on 128.
+            samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.int16) - 128) << 8
+        elif sample_width == 4:
+            samples = (np.frombuffer(frames, dtype="<i4") >> 16).astype(np.int16)
+        else:
+            samples = np.frombuffer(audioop.lin2lin(frames, sample_width, 2), dtype="<i2")
+
+        if channels == 1:
+            return samples
+
+        if channels == 2:
+            # Discord's dominant layout: strided adds plus a shift vectorise far better
+            # than a generic reduction over a length-2 axis.
+            mixed = samples[0::2].astype(np.int32)
+            mixed += samples[1::2]
+            mixed >>= 1
+            return mixed.astype(np.int16)
+
+        mixed = samples.reshape(-1, channels).sum(axis=1, dtype=np.int32) // channels
+        return mixed.astype(np.int16)
+
+    @classmethod
+    def _read_mono_int16(cls, wav_in: wave.Wave_read, sample_width: int, channels: int) -> np.ndarray:
+        """Downmix a WAV stream chunk by chunk so the interleaved frames are never held in full."""
+
+        mono = np.empty(wav_in.getnframes(), dtype=np.int16)
+        position = 0
+        while chunk := wav_in.readframes(cls._WAV_READ_CHUNK_FRAMES):
+            converted = cls._to_mono_int16(chunk, sample_width, channels)
+            mono[position : position + converted.shape[0]] = converted
+            position += converted.shape[0]
+        return mono[:position]
+
+    def _resample(self, samples: np.ndarray, source_rate: int, target_rate: int) -> np.ndarray:
+        """Resample mono int16 samples, preferring soxr's vectorised polyphase filter."""
+
+        if soxr is not None:
+            return soxr.resample(samples, source_rate, target_rate, quality="LQ")
+
+        if source_rate > target_rate and source_rate % target_rate == 0:
+            # Integer ratios (Discord's 48 kHz -> 16 kHz is 3:1) only need a low-pass FIR and a
+            # stride, which NumPy vectorises instead of audioop's per-sample interpolation.
+            factor = source_rate // target_rate
+            taps = _decimation_taps(factor)
+            half = (taps.shape[0] - 1) // 2
+            padded = np.pad(samples.astype(np.float32), (half, half))
+            # Only evaluate the filter at the samples that survive decimation.
+            windows = sliding_window_view(padded, taps.shape[0])[::factor]
+            filtered = windows @ taps[::-1]
+            return np.clip(np.rint(filtered), -32768, 32767).astype(np.int16)
+
+        converted, _ = audioop.ratecv(
+            samples.tobytes(),
+            2,
+            self._NORMALISED_CHANNELS,
+            source_rate,
+            target_rate,
+            None,
+        )
+        return np.frombuffer(converted, dtype="<i2")
 
-        try:
-            with closing(wave.open(stream, "rb")) as wav_in:
-                sample_rate = wav_in.getframerate()
-                sample_width = wav_in.getsampwidth()
-                channels = wav_in.getnchannels()
-                frames = wav_in.readframes(wav_in.getnframes())
-        except (wave.Error, EOFError) as exc:
-            if source_user is not None:
-                _LOGGER.warning(
-                    "Received audio payload for %s is not a valid WAV stream; using raw bytes. Error: %s",
-                    source_user,
-                    exc,
-                )
-            else:
-                _LOGGER.warning("Received audio payload is not a valid WAV stream; using raw bytes. Error: %s", exc)
-            stream.seek(0)
-            return stream
+    def _to_playback_pcm(self, samples: np.ndarray, sample_rate: int) -> bytes:
+        """Convert mono int16 samples to the 48 kHz stereo PCM that ``discord.PCMAudio`` expects."""
+
+        playback_rate, playback_channels, _ = _DISCORD_PCM_FORMAT
+        if sample_rate != playback_rate:
+            samples = self._resample(samples, sample_rate, playback_rate)
 
-        # Reset stream so it can be reused if normalisation is unnecessary.
-        stream.seek(0)
+        stereo = np.repeat(samples.astype("<i2", copy=False), playback_channels)
+        # PCMAudio stops at the first short read, so pad the tail out to a whole Opus frame.
+        frame_samples = discord.opus.Encoder.FRAME_SIZE // 2
+        remainder = stereo.shape[0] % frame_samples
+        if remainder:
+            stereo = np.concatenate((stereo, np.zeros(frame_samples - remainder, dtype="<i2")))
+        return stereo.tobytes()
+
+    def _prepare_transcription_audio(
+        self,
+        audio_bytes: bytes | memoryview,
+        *,
+        source_user: Any | None = None,
+        pcm_format: tuple[int, int, int] | None = None,
+    ) -> np.ndarray | BytesIO:
+        """Decode captured audio into 16 kHz mono float32 samples for Whisper.
+
+        ``audio_bytes`` is a WAV payload unless ``pcm_format`` gives the
+        ``(sample_rate, channels, sample_width)`` of headerless PCM. Payloads
+        that cannot be parsed or converted are returned as a raw stream so the
+        STT backend can still attempt to decode them itself.
+        """
+
+        wav_in: wave.Wave_read | None = None
+        if pcm_format is not None:
+            sample_rate, channels, sample_width = pcm_format
+        else:
+            try:
+                wav_in = wave.open(BytesIO(audio_bytes), "rb")
+            except (wave.Error, EOFError) as exc:
+                if source_user is not None:
+                    _LOGGER.warning(
+                        "Received audio payload for %s is not a valid WAV stream; using raw bytes. Error: %s",
+                        source_user,
+                        exc,
+                    )
+                else:
+                    _LOGGER.warning(
+                        "Received audio payload is not a valid WAV stream; using raw bytes. Error: %s", exc
+                    )
+                return BytesIO(audio_bytes)
+            sample_rate = wav_in.getframerate()
+            sample_width = wav_in.getsampwidth()
+            channels = wav_in.getnchannels()
 
         original_bitrate = sample_rate * sample_width * 8 * channels
         target_rate = self._NORMALISED_SAMPLE_RATE
         target_channels = self._NORMALISED_CHANNELS
 
-        needs_channel_downmix = channels != target_channels
-        needs_resample = sample_rate != target_rate
-        needs_width_adjustment = sample_width not in (1, 2)
-
-        if not (needs_channel_downmix or needs_resample or needs_width_adjustment):
-            _LOGGER.debug(
-                "Audio stream already matches expected format (%d Hz, %d channel(s)).",
-                sample_rate,
-                channels,
-            )
-            stream.seek(0)
-            return stream
-
         try:
-            processed_frames = frames
-            processed_width = sample_width
-
-            if needs_channel_downmix:
-                processed_frames = audioop.tomono(processed_frames, sample_width, 1, 1)
-                processed_width = sample_width
-
-            if needs_width_adjustment and processed_width != 2:
-                processed_frames = audioop.lin2lin(processed_frames, processed_width, 2)
-                processed_width = 2
-
-            if needs_resample:
-                processed_frames, _ = audioop.ratecv(
-                    processed_frames,
-                    processed_width,
-                    target_channels,
-                    sample_rate,
-                    target_rate,
-                    None,
-                )
-
+            if wav_in is not None:
+                with closing(wav_in):
+                    samples = self._read_mono_int16(wav_in, sample_width, channels)
+            else:
+                samples = self._to_mono_int16(audio_bytes, sample_width, channels)
+            if sample_rate != target_rate:
+                samples = self._resample(samples, sample_rate, target_rate)
         except (audioop.error, ValueError) as exc:
             if source_user is not None:
                 _LOGGER.warning(
@@ -1013,30 +1168,21 @@ class VoiceSession:
                     channels,
                     exc,
                 )
-            stream.seek(0)
-            return stream
-
-        output = BytesIO()
-        with closing(wave.open(output, "wb")) as wav_out:
-            wav_out.setnchannels(target_channels)
-            wav_out.setsampwidth(processed_width)
-            wav_out.setframerate(target_rate)
-            wav_out.writeframes(processed_frames)
-
-        output.seek(0)
+            return BytesIO(audio_bytes)
 
         _LOGGER.debug(
-            "Normalised audio stream from %d Hz/%d ch (%d bps) to %d Hz/%d ch (%d bps)%s",
+            "Normalised audio from %d Hz/%d ch (%d bps) to %d Hz/%d ch (%d bps)%s",
             sample_rate,
             channels,
             original_bitrate,
             target_rate,
             target_channels,
-            target_rate * processed_width * 8 * target_channels,
+            target_rate * 2 * 8 * target_channels,
             f" for user {getattr(source_user, 'id', source_user)}" if source_user is not None else "",
         )
 
-        return output
+        # Whisper consumes float32 PCM in [-1.0, 1.0).
+        return samples.astype(np.float32) / 32768.0
 
 
 __all__ = ["VoiceSession", "TranscriptionCallback"]
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import copy
+import json
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, List, Optional, Sequence
 
 import yaml
 
+# libyaml's C parser is several times faster than the pure-Python loader when available.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+
+@dataclass(slots=True)
 class DiscordConfig:
     token: str
     command_prefix: str
@@ -20,9 +26,12 @@ class DiscordConfig:
     reply_in_thread: bool = True
     voice_idle_timeout_seconds: int = 300
     voice_alone_timeout_seconds: int = 60
+    use_fast_event_loop: bool = True
+    shard_count: Optional[int] = None
+    shard_ids: Optional[List[int]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationConfig:
     system_prompt: str
     history_turns: int
@@ -31,9 +40,11 @@ class ConversationConfig:
     top_p: float
     presence_penalty: float
     frequency_penalty: float
+    reply_cache_size: int = 0
+    reply_cache_ttl_seconds: float = 300.0
 
 
-@dataclass
+@dataclass(slots=True)
 class OllamaConfig:
     host: str
     model: str
@@ -42,7 +53,7 @@ class OllamaConfig:
     keep_alive: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class STTConfig:
     model_path: str
     device: str = "cpu"
@@ -53,17 +64,18 @@ class STTConfig:
     min_silence_duration_ms: int = 500
 
 
-@dataclass
+@dataclass(slots=True)
 class KokoroConfig:
     voice: str
     speed: float = 1.0
     emotion: str = "neutral"
+    # Deprecated and ignored: speech is rendered in memory and streamed, never written to disk.
     output_dir: str = "tts_output"
     format: str = "wav"
     lang_code: str = "en"
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     level: str = "INFO"
     log_file: Optional[str] = None
@@ -71,7 +83,7 @@ class LoggingConfig:
     backup_count: int = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     discord: DiscordConfig
     conversation: ConversationConfig
@@ -90,10 +102,6 @@ class AppConfig:
         stt_path = Path(self.stt.model_path)
         if not stt_path.is_absolute():
             self.stt.model_path = str(self.config_dir / stt_path)
-        if self.kokoro.output_dir:
-            kokoro_dir = Path(self.kokoro.output_dir)
-            if not kokoro_dir.is_absolute():
-                self.kokoro.output_dir = str(self.config_dir / kokoro_dir)
         if self.logging.log_file:
             log_file = Path(self.logging.log_file)
             if not log_file.is_absolute():
@@ -121,22 +129,53 @@ def _validate_statuses(statuses: Any) -> List[str]:
     return normalized_statuses
 
 
+def _get_int(section: dict[str, Any], key: str, default: int) -> int:
+    value = section.get(key, default)
+    return value if type(value) is int else int(value)
+
+
+def _get_float(section: dict[str, Any], key: str, default: float) -> float:
+    value = section.get(key, default)
+    return value if type(value) is float else float(value)
+
+
 def load_config(path: Path | str) -> AppConfig:
     config_path = Path(path).expanduser().resolve()
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
-    with config_path.open("r", encoding="utf-8") as handle:
-        raw_config = yaml.safe_load(handle) or {}
+    try:
+        # One stat() both checks existence and provides the cache key.
+        stat = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+
+    # Hand out a copy so callers mutating the config cannot corrupt the cached instance.
+    return copy.deepcopy(_load_config_cached(str(config_path), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> AppConfig:
+    """Parse ``config_path``; the file's mtime and size key the cache so edits are picked up."""
+
+    with open(config_path, "r", encoding="utf-8") as handle:
+        if config_path.endswith(".json"):
+            # JSON is a YAML subset, but the stdlib's C decoder parses it much faster than any YAML loader.
+            raw_config = json.load(handle) or {}
+        else:
+            raw_config = yaml.load(handle, Loader=_YAML_LOADER) or {}
+
+    discord_cfg = raw_config.get("discord") or {}
+    conversation_cfg = raw_config.get("conversation") or {}
+    ollama_cfg = raw_config.get("ollama") or {}
+    stt_cfg = raw_config.get("stt") or {}
+    kokoro_cfg = raw_config.get("kokoro") or {}
+    logging_cfg = raw_config.get("logging") or {}
 
-    discord_cfg = raw_config.get("discord", {})
     statuses = _validate_statuses(discord_cfg.get("statuses", []))
 
     wake_word = str(discord_cfg.get("wake_word", "hey assistant")).strip()
     if not wake_word:
         raise ValueError("Wake word must be a non-empty string")
 
-    status_rotation_seconds = int(discord_cfg.get("status_rotation_seconds", 300))
+    status_rotation_seconds = _get_int(discord_cfg, "status_rotation_seconds", 300)
     if status_rotation_seconds <= 0:
         raise ValueError("status_rotation_seconds must be greater than zero")
 
@@ -144,6 +183,18 @@ def load_config(path: Path | str) -> AppConfig:
     if not command_prefix:
         raise ValueError("command_prefix must not be empty")
 
+    shard_count = discord_cfg.get("shard_count")
+    shard_count = int(shard_count) if shard_count is not None else None
+    if shard_count is not None and shard_count <= 0:
+        raise ValueError("shard_count must be greater than zero")
+    shard_ids = discord_cfg.get("shard_ids")
+    if shard_ids is not None:
+        if shard_count is None:
+            raise ValueError("shard_ids requires shard_count to be set")
+        shard_ids = [int(v) for v in shard_ids]
+        if any(shard_id < 0 or shard_id >= shard_count for shard_id in shard_ids):
+            raise ValueError("shard_ids must be between 0 and shard_count - 1")
+
     app_config = AppConfig(
         discord=DiscordConfig(
             token=str(discord_cfg.get("token", "")),
@@ -153,57 +204,60 @@ def load_config(path: Path | str) -> AppConfig:
             status_rotation_seconds=status_rotation_seconds,
             statuses=statuses,
             wake_word=wake_word.lower(),
-            wake_word_cooldown_seconds=int(discord_cfg.get("wake_word_cooldown_seconds", 10)),
+            wake_word_cooldown_seconds=_get_int(discord_cfg, "wake_word_cooldown_seconds", 10),
             reply_in_thread=bool(discord_cfg.get("reply_in_thread", True)),
             voice_idle_timeout_seconds=max(
-                0, int(discord_cfg.get("voice_idle_timeout_seconds", 300))
+                0, _get_int(discord_cfg, "voice_idle_timeout_seconds", 300)
             ),
             voice_alone_timeout_seconds=max(
-                0, int(discord_cfg.get("voice_alone_timeout_seconds", 60))
+                0, _get_int(discord_cfg, "voice_alone_timeout_seconds", 60)
             ),
+            use_fast_event_loop=bool(discord_cfg.get("use_fast_event_loop", True)),
+            shard_count=shard_count,
+            shard_ids=shard_ids,
         ),
         conversation=ConversationConfig(
-            system_prompt=raw_config.get("conversation", {}).get("system_prompt", "You are an offline assistant."),
-            history_turns=int(raw_config.get("conversation", {}).get("history_turns", 12)),
-            max_tokens=int(raw_config.get("conversation", {}).get("max_tokens", 512)),
-            temperature=float(raw_config.get("conversation", {}).get("temperature", 0.7)),
-            top_p=float(raw_config.get("conversation", {}).get("top_p", 0.9)),
-            presence_penalty=float(raw_config.get("conversation", {}).get("presence_penalty", 0.0)),
-            frequency_penalty=float(raw_config.get("conversation", {}).get("frequency_penalty", 0.0)),
+            system_prompt=conversation_cfg.get("system_prompt", "You are an offline assistant."),
+            history_turns=_get_int(conversation_cfg, "history_turns", 12),
+            max_tokens=_get_int(conversation_cfg, "max_tokens", 512),
+            temperature=_get_float(conversation_cfg, "temperature", 0.7),
+            top_p=_get_float(conversation_cfg, "top_p", 0.9),
+            presence_penalty=_get_float(conversation_cfg, "presence_penalty", 0.0),
+            frequency_penalty=_get_float(conversation_cfg, "frequency_penalty", 0.0),
+            reply_cache_size=max(0, _get_int(conversation_cfg, "reply_cache_size", 0)),
+            reply_cache_ttl_seconds=max(0.0, _get_float(conversation_cfg, "reply_cache_ttl_seconds", 300.0)),
         ),
         ollama=OllamaConfig(
-            host=raw_config.get("ollama", {}).get("host", "http://localhost:11434"),
-            model=raw_config.get("ollama", {}).get("model", "mistral"),
-            request_timeout=int(raw_config.get("ollama", {}).get("request_timeout", 120)),
-            stream=bool(raw_config.get("ollama", {}).get("stream", True)),
-            keep_alive=raw_config.get("ollama", {}).get("keep_alive"),
+            host=ollama_cfg.get("host", "http://localhost:11434"),
+            model=ollama_cfg.get("model", "mistral"),
+            request_timeout=_get_int(ollama_cfg, "request_timeout", 120),
+            stream=bool(ollama_cfg.get("stream", True)),
+            keep_alive=ollama_cfg.get("keep_alive"),
         ),
         stt=STTConfig(
-            model_path=raw_config.get("stt", {}).get("model_path", "models/faster-whisper-medium"),
-            device=raw_config.get("stt", {}).get("device", "cpu"),
-            compute_type=raw_config.get("stt", {}).get("compute_type", "float32"),
-            beam_size=int(raw_config.get("stt", {}).get("beam_size", 5)),
-            vad=bool(raw_config.get("stt", {}).get("vad", True)),
-            energy_threshold=float(raw_config.get("stt", {}).get("energy_threshold", 0.5)),
-            min_silence_duration_ms=int(raw_config.get("stt", {}).get("min_silence_duration_ms", 500)),
+            model_path=stt_cfg.get("model_path", "models/faster-whisper-medium"),
+            device=stt_cfg.get("device", "cpu"),
+            compute_type=stt_cfg.get("compute_type", "float32"),
+            beam_size=_get_int(stt_cfg, "beam_size", 5),
+            vad=bool(stt_cfg.get("vad", True)),
+            energy_threshold=_get_float(stt_cfg, "energy_threshold", 0.5),
+            min_silence_duration_ms=_get_int(stt_cfg, "min_silence_duration_ms", 500),
         ),
         kokoro=KokoroConfig(
-            voice=raw_config.get("kokoro", {}).get("voice", "af_heart"),
-            speed=float(raw_config.get("kokoro", {}).get("speed", 1.0)),
-            emotion=raw_config.get("kokoro", {}).get("emotion", "neutral"),
-            output_dir=raw_config.get("kokoro", {}).get("output_dir", "tts_output"),
-            format=raw_config.get("kokoro", {}).get("format", "wav"),
-            lang_code=raw_config.get("kokoro", {}).get("lang_code", "en"),
+            voice=kokoro_cfg.get("voice", "af_heart"),
+            speed=_get_float(kokoro_cfg, "speed", 1.0),
+            emotion=kokoro_cfg.get("emotion", "neutral"),
+            lang_code=kokoro_cfg.get("lang_code", "en"),
         ),
         logging=LoggingConfig(
-            level=raw_config.get("logging", {}).get("level", "INFO"),
-            log_file=raw_config.get("logging", {}).get("log_file"),
-            max_bytes=int(raw_config.get("logging", {}).get("max_bytes", 1_048_576)),
-            backup_count=int(raw_config.get("logging", {}).get("backup_count", 5)),
+            level=logging_cfg.get("level", "INFO"),
+            log_file=logging_cfg.get("log_file"),
+            max_bytes=_get_int(logging_cfg, "max_bytes", 1_048_576),
+            backup_count=_get_int(logging_cfg, "backup_count", 5),
         ),
     )
 
-    app_config._config_dir = str(config_path.parent)
+    app_config._config_dir = str(Path(config_path).parent)
     app_config.resolve_paths()
 
     if not app_config.discord.token:
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import inspect
+import json
+import os
 import re
 import time
 from contextlib import suppress
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import cycle, islice
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import aiohttp
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
@@ -19,11 +26,12 @@ from .logging_utils import get_logger
 
 _InteractionResponded = getattr(discord, "InteractionResponded", RuntimeError)
 _NotFound = getattr(getattr(discord, "errors", discord), "NotFound", RuntimeError)
+_INTERACTION_RESPONSE_ERRORS: tuple[type[BaseException], ...] = (_InteractionResponded, _NotFound)
 
 _LOGGER = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class WakeConversationState:
     voice_client: discord.VoiceClient
     text_channel_id: Optional[int]
@@ -33,13 +41,104 @@ class WakeConversationState:
     transcripts: List[str] = field(default_factory=list)
     start_time: float = 0.0
     inactivity_task: Optional[asyncio.Task[None]] = None
+    inactivity_deadline: float = 0.0
     max_duration_task: Optional[asyncio.Task[None]] = None
     idle_disconnect_task: Optional[asyncio.Task[None]] = None
     alone_disconnect_task: Optional[asyncio.Task[None]] = None
     last_activity: float = field(default_factory=time.monotonic)
 
 
-class DiscordAssistantBot(commands.Bot):
+# Joins, pins, thread notices and other system messages can never carry a command or wake phrase.
+_USER_MESSAGE_TYPES = frozenset({discord.MessageType.default, discord.MessageType.reply})
+
+# Matches are only tested for truthiness, so "stop talking" and "be quiet" are already covered
+# by their bare "stop" and "quiet" alternatives.
+_STOP_VOICE_REGEX = re.compile(r"\b(?:stop|quiet|silence|shut\s+up)\b", re.IGNORECASE)
+
+# Model output is posted verbatim, so it must never ping users, roles or @everyone.
+_NO_MENTIONS = discord.AllowedMentions.none()
+_MAX_MESSAGE_LENGTH = 2000
+_THREAD_NAME_PREFIX = "Chat with "
+# Discord caps thread names at 100 characters; only the display name needs trimming.
+_THREAD_NAME_BUDGET = 100 - len(_THREAD_NAME_PREFIX)
+
+
+def _split_message(text: str, limit: int = _MAX_MESSAGE_LENGTH) -> List[str]:
+    """Split ``text`` into chunks Discord accepts, preferring line and word boundaries."""
+
+    chunks: List[str] = []
+    while len(text) > limit:
+        cut = text.rfind("\n", 0, limit)
+        if cut <= 0:
+            cut = text.rfind(" ", 0, limit)
+        if cut <= 0:
+            cut = limit
+        chunks.append(text[:cut])
+        text = text[cut:].lstrip()
+    if text:
+        chunks.append(text)
+    return chunks
+
+
+@lru_cache(maxsize=32)
+def _compile_wake_word(wake_word: str) -> tuple[re.Pattern[str], str]:
+    """Return the wake phrase pattern and the casefolded token used to pre-filter text."""
+
+    wake_phrase = wake_word.strip()
+    wake_tokens = re.findall(r"\w+", wake_phrase)
+    if wake_tokens:
+        pattern = r"\W+".join(re.escape(token) for token in wake_tokens)
+    else:
+        pattern = re.escape(wake_phrase or wake_word)
+    # The lookbehind stops ``re`` from using a fast literal scan, so most messages are rejected
+    # first with a C-level substring check on the longest casefolded token of the phrase.
+    hint = max(wake_tokens, key=len).casefold() if wake_tokens else ""
+    return re.compile(rf"(?<!\w){pattern}(?:\W+|$)", re.IGNORECASE), hint
+
+
+@lru_cache(maxsize=8)
+def _guild_objects(guild_ids: tuple[int, ...]) -> tuple[discord.Object, ...]:
+    return tuple(discord.Object(id=guild_id) for guild_id in guild_ids)
+
+
+_COMMAND_SYNC_CACHE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "discord-ai-assistant" / "command-sync.json"
+)
+
+
+def _load_command_sync_cache() -> Dict[str, str]:
+    try:
+        with _COMMAND_SYNC_CACHE.open("r", encoding="utf-8") as handle:
+            cached = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return cached if isinstance(cached, dict) else {}
+
+
+def _store_command_sync_cache(digests: Dict[str, str]) -> None:
+    try:
+        _COMMAND_SYNC_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _COMMAND_SYNC_CACHE.write_text(json.dumps(digests, sort_keys=True), encoding="utf-8")
+    except OSError:
+        _LOGGER.debug("Unable to persist application command sync cache to %s", _COMMAND_SYNC_CACHE)
+
+
+def _build_http_connector() -> Optional[aiohttp.TCPConnector]:
+    """Return a REST connector that caches DNS and keeps connections warm between replies.
+
+    aiohttp connectors must be created inside a running loop; outside one discord.py's
+    default connector is used instead.
+    """
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    # limit=0 keeps discord.py's own unlimited pool; only DNS caching and keep-alive are tuned.
+    return aiohttp.TCPConnector(limit=0, ttl_dns_cache=300, use_dns_cache=True, keepalive_timeout=75)
+
+
+class DiscordAssistantBot(commands.AutoShardedBot):
     def __init__(
         self,
         config: AppConfig,
@@ -48,9 +147,26 @@ class DiscordAssistantBot(commands.Bot):
     ) -> None:
         intents = discord.Intents.default()
         intents.message_content = True
-        intents.members = True
+        # Voice channel membership comes from voice state events: VocalGuildChannel.members, which the
+        # alone-in-channel disconnect reads, is fed by the voice-only member cache. So the member
+        # firehose, startup chunking and typing events are not needed.
+        intents.members = False
+        intents.typing = False
         intents.voice_states = True
-        super().__init__(command_prefix=config.discord.command_prefix, intents=intents)
+        status_activities = tuple(discord.Game(name=status) for status in config.discord.statuses)
+        super().__init__(
+            command_prefix=config.discord.command_prefix,
+            intents=intents,
+            member_cache_flags=discord.MemberCacheFlags.from_intents(intents),
+            chunk_guilds_at_startup=False,
+            max_messages=None,
+            connector=_build_http_connector(),
+            shard_count=config.discord.shard_count,
+            shard_ids=config.discord.shard_ids,
+            # Sent with every IDENTIFY, so a shard that reconnects on its own (``shard_ready`` without
+            # ``ready``) comes back with a presence even when rotate_status skips an unchanged one.
+            activity=status_activities[0] if status_activities else None,
+        )
 
         # ``commands.Bot`` gained a ``tree`` attribute in discord.py v2.0. Older
         # installations (or compatible forks) may not provide it, which would
@@ -63,23 +179,29 @@ class DiscordAssistantBot(commands.Bot):
             setattr(self, "tree", self._command_tree)
 
         self.config_data = config
+        # Per-event handlers read the discord section directly instead of walking config_data each time.
+        self._discord_config = config.discord
         self.conversation_manager = conversation_manager
         self.voice_session = voice_session
-        self._status_index = 0
+        self._status_activities = status_activities
+        self._status_cycle = cycle(self._status_activities)
+        self._last_status_activity: Optional[discord.Game] = None
+        # Static prefixes are resolved to a tuple once so on_message needs a single startswith call.
+        prefix = self.command_prefix
+        self._command_prefixes: Optional[tuple[str, ...]]
+        if isinstance(prefix, str):
+            self._command_prefixes = (prefix,)
+        elif callable(prefix):
+            self._command_prefixes = None
+        else:
+            self._command_prefixes = tuple(prefix)
         self._commands_synced = False
         self._voice_states: Dict[int, WakeConversationState] = {}
         self._wake_cooldowns: Dict[int, float] = {}
-        wake_phrase = config.discord.wake_word.strip()
-        wake_tokens = [token for token in re.findall(r"\w+", wake_phrase)]
-        if wake_tokens:
-            pattern = r"\W+".join(re.escape(token) for token in wake_tokens)
-        else:
-            pattern = re.escape(wake_phrase or config.discord.wake_word)
-        self._wake_word_regex = re.compile(rf"(?<!\w){pattern}(?:\W+|$)", re.IGNORECASE)
-        self._stop_voice_regex = re.compile(
-            r"\b(?:stop(?:\s+(?:talking|speaking|playing|playback|audio))?|shut\s+up|be\s+quiet|quiet|silence)\b",
-            re.IGNORECASE,
-        )
+        # Resolve the base class hook once; voice state updates are dispatched for every member move.
+        self._parent_voice_state_handler = getattr(super(), "on_voice_state_update", None)
+        self._parent_voice_state_handler_is_async = inspect.iscoroutinefunction(self._parent_voice_state_handler)
+        self._wake_word_regex, self._wake_word_hint = _compile_wake_word(config.discord.wake_word)
         self.status_rotator = tasks.loop(seconds=config.discord.status_rotation_seconds)(self.rotate_status)
         self._register_commands()
 
@@ -90,17 +212,51 @@ class DiscordAssistantBot(commands.Bot):
         if self._commands_synced:
             return
 
-        try:
-            if self.config_data.discord.guild_ids:
-                for guild_id in self.config_data.discord.guild_ids:
-                    await self._command_tree.sync(guild=discord.Object(id=guild_id))
-            else:
-                await self._command_tree.sync()
-        except AttributeError:  # pragma: no cover - defensive guard for unsupported clients
+        guild_objects = _guild_objects(tuple(self.config_data.discord.guild_ids or ()))
+        targets: List[Optional[discord.Object]] = list(guild_objects) if guild_objects else [None]
+        synced_digests = _load_command_sync_cache()
+
+        pending: List[tuple[str, Optional[discord.Object], Optional[str]]] = []
+        for guild in targets:
+            cache_key = f"{self.application_id}:{guild.id if guild is not None else 'global'}"
+            digest = self._command_tree_digest(guild)
+            if digest is not None and synced_digests.get(cache_key) == digest:
+                _LOGGER.debug("Application commands for %s are unchanged; skipping sync", cache_key)
+                continue
+            pending.append((cache_key, guild, digest))
+
+        sync = getattr(self._command_tree, "sync", None)
+        if sync is None:  # Defensive guard for unsupported clients
             _LOGGER.debug("Command tree synchronization is unavailable on this Discord client")
             return
 
-        self._commands_synced = True
+        # Each sync is a bulk-overwrite REST call; issue them together rather than one after another,
+        # and let every guild finish so one failure does not discard the others' results.
+        results = await asyncio.gather(*(sync(guild=guild) for _, guild, _ in pending), return_exceptions=True)
+
+        all_synced = True
+        for (cache_key, _, digest), result in zip(pending, results):
+            if isinstance(result, BaseException):
+                all_synced = False
+                _LOGGER.error("Failed to sync application commands for %s", cache_key, exc_info=result)
+                continue
+            if digest is not None:
+                synced_digests[cache_key] = digest
+        if pending:
+            _store_command_sync_cache(synced_digests)
+
+        # A failed guild is retried on the next call; the ones that succeeded are skipped by digest.
+        self._commands_synced = all_synced
+
+    def _command_tree_digest(self, guild: Optional[discord.Object]) -> Optional[str]:
+        """Hash the command payloads registered for ``guild``, or ``None`` if they cannot be serialised."""
+
+        try:
+            payload = [command.to_dict(self._command_tree) for command in self._command_tree.get_commands(guild=guild)]
+            encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        except (AttributeError, TypeError, ValueError):
+            return None
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
 
     def _register_commands(self) -> None:
         slash_registration = self._register_slash_commands
@@ -109,17 +265,14 @@ class DiscordAssistantBot(commands.Bot):
         prefix_registration()
 
     def _register_slash_commands(self) -> None:
-        guild_ids = self.config_data.discord.guild_ids or []
-        guild_objects = [discord.Object(id=guild_id) for guild_id in guild_ids]
+        guild_objects = _guild_objects(tuple(self.config_data.discord.guild_ids or ()))
 
-        def _register_command(command: app_commands.Command) -> None:
-            if guild_objects:
-                for guild in guild_objects:
-                    self._command_tree.add_command(command.copy(), guild=guild)
-            else:
-                self._command_tree.add_command(command)
+        def _register_command(command: app_commands.Command | app_commands.Group) -> None:
+            self._command_tree.add_command(command)
 
         async def reset_handler(interaction: discord.Interaction) -> None:
+            # Resetting waits on the channel's conversation lock, which a reply in progress may hold.
+            await self._defer_interaction(interaction)
             try:
                 await self._reset_channel(interaction.channel_id)
             except RuntimeError as exc:
@@ -171,9 +324,7 @@ class DiscordAssistantBot(commands.Bot):
             reply = await ask_handler(interaction, question)
             if reply is None:
                 return
-            await self._send_interaction_message(
-                interaction, reply, prefer_followup=True
-            )
+            await self._send_interaction_reply(interaction, reply)
 
         @ask_group.command(
             name="voice",
@@ -215,11 +366,7 @@ class DiscordAssistantBot(commands.Bot):
                 )
                 return
 
-            await self._send_interaction_message(
-                interaction,
-                reply,
-                prefer_followup=True,
-            )
+            await self._send_interaction_reply(interaction, reply)
 
         _register_command(ask_group)
 
@@ -251,6 +398,7 @@ class DiscordAssistantBot(commands.Bot):
             description="Disconnect the assistant from the voice channel",
         )
         async def leave_command(interaction: discord.Interaction) -> None:
+            await self._defer_interaction(interaction)
             voice_client = getattr(interaction.guild, "voice_client", None)
             if voice_client and voice_client.channel:
                 await self._cleanup_voice_state(voice_client.channel.id)
@@ -269,11 +417,9 @@ class DiscordAssistantBot(commands.Bot):
             text="What you want the assistant to say",
         )
         async def say_command(interaction: discord.Interaction, text: str) -> None:
-            voice_client = (
-                getattr(interaction.guild, "voice_client", None)
-                if interaction.guild
-                else None
-            )
+            # Synthesis (and possibly joining voice) regularly outlasts Discord's 3 second ack window.
+            await self._defer_interaction(interaction)
+            voice_client = getattr(interaction.guild, "voice_client", None)
             if not voice_client or not getattr(voice_client, "channel", None):
                 try:
                     voice_client, _ = await self._ensure_voice_connection(
@@ -303,11 +449,7 @@ class DiscordAssistantBot(commands.Bot):
             description="Stop the assistant's current voice playback",
         )
         async def stop_command(interaction: discord.Interaction) -> None:
-            voice_client = (
-                getattr(interaction.guild, "voice_client", None)
-                if interaction.guild
-                else None
-            )
+            voice_client = getattr(interaction.guild, "voice_client", None)
             if not voice_client or not getattr(voice_client, "channel", None):
                 await self._send_interaction_message(
                     interaction,
@@ -339,6 +481,13 @@ class DiscordAssistantBot(commands.Bot):
 
         _register_command(status_command)
 
+        if guild_objects:
+            # Guild scoping shares the global command objects with every guild instead of copying
+            # each command per guild; the global set is then cleared so only guild commands sync.
+            for guild in guild_objects:
+                self._command_tree.copy_global_to(guild=guild)
+            self._command_tree.clear_commands(guild=None)
+
     def _register_prefix_commands(self) -> None:
 
         @self.command(name="reset", help="Clear the assistant conversation history for this channel")
@@ -360,7 +509,8 @@ class DiscordAssistantBot(commands.Bot):
                 except RuntimeError as exc:
                     await ctx.send(str(exc))
                     return
-            await ctx.send(reply)
+            for chunk in _split_message(reply):
+                await ctx.send(chunk, allowed_mentions=_NO_MENTIONS)
 
         @self.command(name="join", help="Summon the assistant to your current voice channel")
         async def join_command(ctx: commands.Context) -> None:
@@ -384,7 +534,7 @@ class DiscordAssistantBot(commands.Bot):
 
         @self.command(name="leave", help="Disconnect the assistant from the voice channel")
         async def leave_command(ctx: commands.Context) -> None:
-            voice_client = getattr(ctx.guild, "voice_client", None) if ctx.guild else None
+            voice_client = getattr(ctx.guild, "voice_client", None)
             if voice_client and voice_client.channel:
                 await self._cleanup_voice_state(voice_client.channel.id)
             await self.voice_session.leave(ctx)
@@ -392,7 +542,7 @@ class DiscordAssistantBot(commands.Bot):
 
         @self.command(name="say", help="Have the assistant speak in the connected voice channel")
         async def say_command(ctx: commands.Context, *, text: str) -> None:
-            voice_client = getattr(ctx.guild, "voice_client", None) if ctx.guild else None
+            voice_client = getattr(ctx.guild, "voice_client", None)
             if not voice_client:
                 await ctx.send("I need to be in a voice channel to speak. Use the !join command first.")
                 return
@@ -404,7 +554,7 @@ class DiscordAssistantBot(commands.Bot):
 
         @self.command(name="stop", help="Stop the assistant's current voice playback")
         async def stop_command(ctx: commands.Context) -> None:
-            voice_client = getattr(ctx.guild, "voice_client", None) if ctx.guild else None
+            voice_client = getattr(ctx.guild, "voice_client", None)
             if not voice_client:
                 await ctx.send("I'm not connected to a voice channel.")
                 return
@@ -480,6 +630,7 @@ class DiscordAssistantBot(commands.Bot):
         ephemeral: bool = False,
         prefer_followup: bool = False,
         embed: Optional[discord.Embed] = None,
+        allowed_mentions: Optional[discord.AllowedMentions] = None,
     ) -> None:
         kwargs: Dict[str, Any] = {}
         if content is not None:
@@ -488,44 +639,59 @@ class DiscordAssistantBot(commands.Bot):
             kwargs["embed"] = embed
         if not kwargs:
             return
+        if allowed_mentions is not None:
+            kwargs["allowed_mentions"] = allowed_mentions
 
         response = getattr(interaction, "response", None)
-        followup = getattr(interaction, "followup", None)
-
-        async def _send_via_followup() -> bool:
-            if followup is None or not hasattr(followup, "send"):
-                return False
-            try:
-                await followup.send(**kwargs, ephemeral=ephemeral)
-                return True
-            except _NotFound:
-                return False
+        is_done = getattr(response, "is_done", None)
+        response_done = callable(is_done) and is_done()
 
-        if prefer_followup:
-            if await _send_via_followup():
+        # Decide the route once and try the followup webhook at most once; a failed followup is a
+        # REST round-trip, and repeating it cannot succeed for the same interaction.
+        if prefer_followup or response_done:
+            if await self._send_followup(interaction, kwargs, ephemeral):
                 return
+            followup_tried = True
+        else:
+            followup_tried = False
 
-        if response is not None:
-            is_done = getattr(response, "is_done", None)
-            if callable(is_done) and is_done():
-                if await _send_via_followup():
-                    return
+        if not response_done:
             send_message = getattr(response, "send_message", None)
             if callable(send_message):
                 try:
                     await send_message(ephemeral=ephemeral, **kwargs)
                     return
-                except (_InteractionResponded, _NotFound):
-                    if await _send_via_followup():
-                        return
+                except _INTERACTION_RESPONSE_ERRORS:
+                    pass
 
-        if await _send_via_followup():
+        if not followup_tried and await self._send_followup(interaction, kwargs, ephemeral):
             return
 
         channel = getattr(interaction, "channel", None)
         if channel is not None and hasattr(channel, "send"):
             await channel.send(**kwargs)
 
+    async def _send_interaction_reply(self, interaction: discord.Interaction, reply: str) -> None:
+        """Post model output for an interaction in Discord-sized chunks without pinging anyone."""
+
+        for chunk in _split_message(reply):
+            await self._send_interaction_message(
+                interaction, chunk, prefer_followup=True, allowed_mentions=_NO_MENTIONS
+            )
+
+    @staticmethod
+    async def _send_followup(
+        interaction: discord.Interaction, kwargs: Dict[str, Any], ephemeral: bool
+    ) -> bool:
+        followup = getattr(interaction, "followup", None)
+        if followup is None or not hasattr(followup, "send"):
+            return False
+        try:
+            await followup.send(**kwargs, ephemeral=ephemeral)
+        except _NotFound:
+            return False
+        return True
+
     async def _reset_channel(self, channel_id: Optional[int]) -> None:
         if channel_id is None:
             raise RuntimeError("Unable to determine which channel to reset.")
@@ -537,6 +703,7 @@ class DiscordAssistantBot(commands.Bot):
         return await self.conversation_manager.generate_reply(channel_id, question)
 
     def _build_status_embed(self) -> discord.Embed:
+        # Building a fresh embed is cheaper than copying a cached one, and callers may modify what they get.
         embed = discord.Embed(title="Assistant Status", color=discord.Color.blurple())
         embed.add_field(name="Model", value=self.config_data.ollama.model, inline=False)
         embed.add_field(name="Wake Word", value=self.config_data.discord.wake_word, inline=False)
@@ -608,13 +775,14 @@ class DiscordAssistantBot(commands.Bot):
             return
 
         state.last_activity = time.monotonic()
-        timeout = self.config_data.discord.voice_idle_timeout_seconds
+        timeout = self._discord_config.voice_idle_timeout_seconds
         if timeout <= 0:
             return
 
+        # A running idle task re-reads last_activity whenever it wakes, so it only needs creating once.
         task = state.idle_disconnect_task
         if task and not task.done():
-            task.cancel()
+            return
 
         state.idle_disconnect_task = asyncio.create_task(
             self._disconnect_if_idle(channel_id, timeout)
@@ -730,11 +898,12 @@ class DiscordAssistantBot(commands.Bot):
         state = self._voice_states.get(channel_id)
         if not state:
             return
+        # Each utterance only pushes the deadline back; the running timer task re-checks it on wake-up
+        # instead of being cancelled and recreated for every transcript.
+        state.inactivity_deadline = time.monotonic() + delay
         if state.inactivity_task and not state.inactivity_task.done():
-            state.inactivity_task.cancel()
-        state.inactivity_task = asyncio.create_task(
-            self._end_conversation_after(channel_id, delay, "silence")
-        )
+            return
+        state.inactivity_task = asyncio.create_task(self._end_conversation_when_silent(channel_id))
 
     def _set_max_duration_timer(self, channel_id: int, duration: float = 30.0) -> None:
         state = self._voice_states.get(channel_id)
@@ -746,6 +915,17 @@ class DiscordAssistantBot(commands.Bot):
             self._end_conversation_after(channel_id, duration, "maximum duration")
         )
 
+    async def _end_conversation_when_silent(self, channel_id: int) -> None:
+        while True:
+            state = self._voice_states.get(channel_id)
+            if state is None:
+                return
+            remaining = state.inactivity_deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(remaining)
+        await self._finalize_conversation(channel_id, "silence")
+
     async def _end_conversation_after(
         self, channel_id: int, delay: float, reason: str
     ) -> None:
@@ -761,19 +941,20 @@ class DiscordAssistantBot(commands.Bot):
         channel = getattr(voice_client, "channel", None)
         if channel is None:
             return
-        state = self._voice_states.get(channel.id)
+        channel_id = channel.id
+        state = self._voice_states.get(channel_id)
 
         if voice_client.is_playing() and self._is_voice_stop_request(transcript):
             if state:
                 state.voice_client = voice_client
-                self._mark_voice_activity(channel.id)
+                self._mark_voice_activity(channel_id)
             stopped = False
             try:
                 stopped = self.voice_session.stop_speaking(voice_client)
             except Exception:
                 _LOGGER.exception(
                     "Failed to stop voice playback in channel %s via voice command",
-                    getattr(channel, "id", "unknown"),
+                    channel_id,
                 )
             message = (
                 "Stopped the current voice playback."
@@ -787,10 +968,10 @@ class DiscordAssistantBot(commands.Bot):
             return
 
         state.voice_client = voice_client
-        self._mark_voice_activity(channel.id)
+        self._mark_voice_activity(channel_id)
         _LOGGER.info("Transcribed from %s: %s", user, transcript)
 
-        match = self._wake_word_regex.search(transcript)
+        match = self._find_wake_word(transcript)
         now = time.monotonic()
 
         if not state.active:
@@ -804,26 +985,27 @@ class DiscordAssistantBot(commands.Bot):
             post_wake = transcript[match.end():].strip()
             if post_wake:
                 state.transcripts.append(post_wake)
-            self._set_inactivity_timer(channel.id)
-            self._set_max_duration_timer(channel.id)
+            self._set_inactivity_timer(channel_id)
+            self._set_max_duration_timer(channel_id)
             return
 
+        # Fragments are stored stripped so finalising only needs a single join.
         if match:
-            content = transcript[match.end():].strip() or transcript
+            content = transcript[match.end():].strip() or transcript.strip()
         else:
-            content = transcript
+            content = transcript.strip()
 
         if content:
             state.transcripts.append(content)
-        self._set_inactivity_timer(channel.id)
+        self._set_inactivity_timer(channel_id)
 
         if now - state.start_time >= 30.0:
-            await self._finalize_conversation(channel.id, "maximum duration")
+            await self._finalize_conversation(channel_id, "maximum duration")
 
     def _is_voice_stop_request(self, transcript: str) -> bool:
         if not transcript:
             return False
-        return bool(self._stop_voice_regex.search(transcript))
+        return bool(_STOP_VOICE_REGEX.search(transcript))
 
     async def _send_voice_feedback(
         self, state: WakeConversationState | None, message: str
@@ -844,7 +1026,7 @@ class DiscordAssistantBot(commands.Bot):
 
         try:
             result = send(message)
-            if inspect.isawaitable(result):
+            if asyncio.iscoroutine(result) or hasattr(result, "__await__"):
                 await result
         except Exception:  # pragma: no cover - defensive logging
             _LOGGER.exception(
@@ -878,7 +1060,7 @@ class DiscordAssistantBot(commands.Bot):
             with suppress(asyncio.CancelledError):
                 await max_duration_task
 
-        transcript_text = " ".join(state.transcripts).strip()
+        transcript_text = " ".join(state.transcripts)
         state.transcripts.clear()
         if not transcript_text:
             _LOGGER.info(
@@ -891,28 +1073,28 @@ class DiscordAssistantBot(commands.Bot):
         text_channel_id = state.text_channel_id or channel_id
         reply = await self.conversation_manager.generate_reply(text_channel_id, transcript_text)
 
-        text_channel = self.get_channel(text_channel_id)
-        if isinstance(text_channel, (discord.TextChannel, discord.Thread)):
-            speaker = state.initiator_name or "User"
-            await text_channel.send(
-                f"**{speaker}:** {transcript_text}\n**Assistant:** {reply}"
-            )
-        else:
-            _LOGGER.warning(
-                "No text channel available to post transcription response for channel %s",
-                channel_id,
-            )
+        speaker = state.initiator_name or "User"
 
-        try:
-            await self.voice_session.speak(state.voice_client, reply)
-        except Exception:  # pragma: no cover - defensive logging
-            _LOGGER.exception("Failed to play synthesized speech in channel %s", channel_id)
+        async def post_transcript() -> None:
+            text_channel = self.get_channel(text_channel_id)
+            if not isinstance(text_channel, (discord.TextChannel, discord.Thread)):
+                _LOGGER.warning(
+                    "No text channel available to post transcription response for channel %s",
+                    channel_id,
+                )
+                return
+            for chunk in _split_message(f"**{speaker}:** {transcript_text}\n**Assistant:** {reply}"):
+                await text_channel.send(chunk, allowed_mentions=_NO_MENTIONS)
+
+        await asyncio.gather(post_transcript(), self._speak_reply(state.voice_client, reply))
 
         state.initiator_id = None
         state.initiator_name = None
 
     async def on_ready(self) -> None:
         _LOGGER.info("Logged in as %s (%s)", self.user, self.user.id if self.user else "unknown")
+        # A fresh gateway session starts without our presence, so the next status must be sent.
+        self._last_status_activity = None
         await self.rotate_status()
         if not self.status_rotator.is_running():
             self.status_rotator.start()
@@ -924,70 +1106,143 @@ class DiscordAssistantBot(commands.Bot):
         before: discord.VoiceState,
         after: discord.VoiceState,
     ) -> None:
-        parent_handler = getattr(super(), "on_voice_state_update", None)
+        parent_handler = self._parent_voice_state_handler
         if parent_handler:
             result = parent_handler(member, before, after)
-            if inspect.isawaitable(result):
+            if self._parent_voice_state_handler_is_async:
                 await result
         for channel in (getattr(before, "channel", None), getattr(after, "channel", None)):
             self._update_voice_channel_population(channel)
 
+    def _find_wake_word(self, text: str) -> Optional[re.Match[str]]:
+        if self._wake_word_hint and self._wake_word_hint not in text.casefold():
+            return None
+        return self._wake_word_regex.search(text)
+
     async def close(self) -> None:
         self.status_rotator.cancel()
+        # Pending idle/alone/wake timers would otherwise outlive the client and fire against a closed connection.
+        for channel_id in list(self._voice_states):
+            await self._cleanup_voice_state(channel_id)
         await super().close()
 
     async def on_message(self, message: discord.Message) -> None:
-        if message.author.bot or not message.content:
+        content = message.content
+        if (
+            not content
+            or message.author.bot
+            or message.webhook_id is not None
+            or message.type not in _USER_MESSAGE_TYPES
+        ):
+            return
+        prefixes = self._command_prefixes
+        if prefixes is None:
+            resolved = await self.get_prefix(message)
+            prefixes = (resolved,) if isinstance(resolved, str) else tuple(resolved)
+        # Only prefixed messages can be commands, so chat skips the command parser entirely.
+        if content.startswith(prefixes):
+            await self.process_commands(message)
             return
-        await self.process_commands(message)
-        if message.content.startswith(self.command_prefix):
+        wake_match = self._find_wake_word(content)
+        if not wake_match:
             return
-        if not self._wake_word_regex.search(message.content):
+        # Without permission to post, the reply is still worth generating if it can be spoken.
+        can_post = self._can_reply_in(message)
+        if not can_post and getattr(message.guild, "voice_client", None) is None:
+            _LOGGER.debug("Ignoring wake word in channel %s: missing permission to reply", message.channel.id)
             return
+        channel_id = message.channel.id
         now = time.monotonic()
-        last = self._wake_cooldowns.get(message.channel.id, 0.0)
-        if now - last < self.config_data.discord.wake_word_cooldown_seconds:
-            return
-        self._wake_cooldowns[message.channel.id] = now
-        cleaned = self._wake_word_regex.sub("", message.content, count=1).strip()
-        prompt = cleaned or message.content
-        reply = await self.conversation_manager.generate_reply(message.channel.id, prompt)
-        await self._send_reply(message, reply)
-        if message.guild and message.guild.voice_client:
-            try:
-                channel = getattr(message.guild.voice_client, "channel", None)
-                if channel is not None:
-                    self._mark_voice_activity(channel.id)
-                await self.voice_session.speak(message.guild.voice_client, reply)
-            except Exception:  # pragma: no cover - best effort
-                _LOGGER.exception("Failed to play synthesized speech")
+        cooldown = self._discord_config.wake_word_cooldown_seconds
+        cooldowns = self._wake_cooldowns
+        if now - cooldowns.get(channel_id, 0.0) < cooldown:
+            return
+        # Re-insert so the dict stays ordered by trigger time, then drop expired entries from the
+        # front; only channels still cooling down are kept, however many channels the bot sees.
+        cooldowns.pop(channel_id, None)
+        cooldowns[channel_id] = now
+        for stale_id, triggered_at in list(islice(cooldowns.items(), 8)):
+            if now - triggered_at < cooldown:
+                break
+            del cooldowns[stale_id]
+        # Cut the wake phrase out using the match we already have instead of scanning again with sub().
+        cleaned = (content[: wake_match.start()] + content[wake_match.end() :]).strip()
+        prompt = cleaned or content
+        reply = await self.conversation_manager.generate_reply(channel_id, prompt)
+        voice_client = getattr(message.guild, "voice_client", None)
+        if not voice_client:
+            if can_post:
+                await self._send_reply(message, reply)
+            return
+        voice_channel = getattr(voice_client, "channel", None)
+        if voice_channel is not None:
+            self._mark_voice_activity(voice_channel.id)
+        if not can_post:
+            await self._speak_reply(voice_client, reply)
+            return
+        # Synthesis takes far longer than posting the text, so both run together.
+        await asyncio.gather(self._send_reply(message, reply), self._speak_reply(voice_client, reply))
+
+    def _can_reply_in(self, message: discord.Message) -> bool:
+        """Check, from the local permission cache, that ``_send_reply`` will be allowed to post."""
+
+        channel = message.channel
+        me = getattr(message.guild, "me", None)
+        permissions_for = getattr(channel, "permissions_for", None)
+        if me is None or not callable(permissions_for):
+            return True
+        permissions = permissions_for(me)
+        if isinstance(channel, discord.Thread):
+            return permissions.send_messages_in_threads
+        if self._discord_config.reply_in_thread and isinstance(channel, discord.TextChannel):
+            # The reply goes to the message's thread, which is created first when it does not exist yet.
+            if message.thread is None and not permissions.create_public_threads:
+                return False
+            return permissions.send_messages_in_threads
+        return permissions.send_messages
+
+    async def _speak_reply(self, voice_client: discord.VoiceClient, reply: str) -> None:
+        try:
+            await self.voice_session.speak(voice_client, reply)
+        except Exception:  # pragma: no cover - best effort
+            _LOGGER.exception(
+                "Failed to play synthesized speech in channel %s",
+                getattr(getattr(voice_client, "channel", None), "id", "unknown"),
+            )
 
     async def rotate_status(self) -> None:
-        status_text = self.config_data.discord.statuses[self._status_index % len(self.config_data.discord.statuses)]
-        self._status_index += 1
-        await self.change_presence(activity=discord.Game(name=status_text))
+        activity = next(self._status_cycle, None)
+        # With a single status every tick would resend the same presence over the gateway.
+        if activity is None or activity is self._last_status_activity:
+            return
+        self._last_status_activity = activity
+        await self.change_presence(activity=activity)
 
     async def _send_reply(self, message: discord.Message, reply: str) -> None:
         if not reply:
             _LOGGER.warning("Empty reply generated for message %s", message.id)
             return
+        chunks = _split_message(reply)
         try:
-            if self.config_data.discord.reply_in_thread and isinstance(message.channel, discord.TextChannel):
+            if self._discord_config.reply_in_thread and isinstance(message.channel, discord.TextChannel):
                 thread = message.thread
                 if thread is None:
-                    thread_name = f"Chat with {message.author.display_name}"[:100]
+                    thread_name = _THREAD_NAME_PREFIX + message.author.display_name[:_THREAD_NAME_BUDGET]
                     thread = await message.create_thread(name=thread_name)
-                await thread.send(reply)
+                for chunk in chunks:
+                    await thread.send(chunk, allowed_mentions=_NO_MENTIONS)
             else:
-                await message.reply(reply, mention_author=False)
+                await message.reply(chunks[0], mention_author=False, allowed_mentions=_NO_MENTIONS)
+                for chunk in chunks[1:]:
+                    await message.channel.send(chunk, allowed_mentions=_NO_MENTIONS)
         except discord.Forbidden:
             _LOGGER.warning("Missing permissions to send message in channel %s", message.channel.id)
         except discord.HTTPException:
             _LOGGER.exception("Failed to send reply to message %s", message.id)
 
 
-def create_bot(config: AppConfig, conversation_manager: ConversationManager, voice_session: VoiceSession) -> DiscordAssistantBot:
-    return DiscordAssistantBot(config, conversation_manager, voice_session)
+# The factory takes exactly the constructor's arguments, so it is the class itself.
+create_bot = DiscordAssistantBot
 
 
 __all__ = ["DiscordAssistantBot", "create_bot"]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
@@ -65,8 +67,18 @@ class StyledFormatter(logging.Formatter):
 
 from .config import LoggingConfig
 
+_LISTENER: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    global _LISTENER
+    if _LISTENER is not None:
+        _LISTENER.stop()
+        _LISTENER = None
+
 
 def configure_logging(config: LoggingConfig) -> None:
+    global _LISTENER
     level = getattr(logging, config.level.upper(), logging.INFO)
 
     console_handler = logging.StreamHandler()
@@ -75,7 +87,7 @@ def configure_logging(config: LoggingConfig) -> None:
         StyledFormatter("[%(asctime)s] [%(levelname)s] %(name)s: %(message)s", "%Y-%m-%d %H:%M:%S")
     )
 
-    logging.basicConfig(level=level, handlers=[console_handler], force=True)
+    handlers: list[logging.Handler] = [console_handler]
 
     if config.log_file:
         log_path = Path(config.log_file)
@@ -93,7 +105,20 @@ def configure_logging(config: LoggingConfig) -> None:
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
         )
-        logging.getLogger().addHandler(handler)
+        handlers.append(handler)
+
+    # Records are only queued on the calling thread; console and file writes happen on the
+    # listener thread so a slow terminal or disk never stalls the asyncio event loop.
+    _stop_listener()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=level, handlers=[queue_handler], force=True)
+    _LISTENER = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _LISTENER.start()
+
+
+atexit.register(_stop_listener)
 
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
@@ -4,6 +4,14 @@ import argparse
 import asyncio
 from pathlib import Path
 
+try:  # pragma: no cover - optional dependency resolution
+    import uvloop as _fast_loop
+except ImportError:  # pragma: no cover - winloop provides the same policy on Windows
+    try:
+        import winloop as _fast_loop
+    except ImportError:  # pragma: no cover - falls back to the default asyncio loop
+        _fast_loop = None  # type: ignore[assignment]
+
 from .ai.conversation_manager import ConversationManager
 from .ai.ollama_client import OllamaClient
 from .ai.stt import SpeechToText
@@ -55,9 +63,18 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _install_event_loop_policy(config: AppConfig) -> None:
+    """Run the bot on the libuv-based loop when it is installed and not disabled."""
+
+    if _fast_loop is None or not config.discord.use_fast_event_loop:
+        return
+    asyncio.set_event_loop_policy(_fast_loop.EventLoopPolicy())
+
+
 def main() -> None:
     args = parse_args()
     config = load_config(args.config)
+    _install_event_loop_policy(config)
     try:
         asyncio.run(run_bot(config))
     except KeyboardInterrupt:
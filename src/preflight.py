@@ -4,7 +4,6 @@ import asyncio
 import importlib
 from ctypes.util import find_library
 from pathlib import Path
-from shutil import which
 
 import discord
 
@@ -16,14 +15,6 @@ from .logging_utils import get_logger
 _LOGGER = get_logger(__name__)
 
 
-def _ensure_ffmpeg_available() -> None:
-    if which("ffmpeg") is None:
-        raise RuntimeError(
-            "FFmpeg executable not found on PATH. Install FFmpeg to enable Discord voice playback."
-        )
-    _LOGGER.debug("FFmpeg binary located successfully.")
-
-
 def _ensure_opus_loaded() -> None:
     if discord.opus.is_loaded():
         return
@@ -111,7 +102,6 @@ def _ensure_stt_assets(config: AppConfig) -> None:
 async def run_preflight_checks(config: AppConfig, ollama_client: OllamaClient) -> None:
     """Raise early errors for missing runtime dependencies before starting the bot."""
 
-    _ensure_ffmpeg_available()
     _ensure_opus_loaded()
     _ensure_discord_sinks_available()
     _ensure_stt_assets(config)
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from src.config import (
+    AppConfig,
+    ConversationConfig,
+    DiscordConfig,
+    KokoroConfig,
+    OllamaConfig,
+    STTConfig,
+)
+
+
+def _run_on_private_loop(coro):
+    # A private loop keeps the module-level loop test_voice_session installs untouched.
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+@pytest.fixture()
+def run_async():
+    return _run_on_private_loop
+
+
+@pytest.fixture()
+def make_conversation_config():
+    def factory(**overrides) -> ConversationConfig:
+        values = dict(
+            system_prompt="You are a bot.",
+            history_turns=10,
+            max_tokens=256,
+            temperature=0.7,
+            top_p=0.9,
+            presence_penalty=0.0,
+            frequency_penalty=0.0,
+        )
+        values.update(overrides)
+        return ConversationConfig(**values)
+
+    return factory
+
+
+@pytest.fixture()
+def make_app_config(make_conversation_config):
+    def factory(**discord_overrides) -> AppConfig:
+        values = dict(
+            token="dummy-token",
+            command_prefix="!",
+            owner_ids=[],
+            guild_ids=[],
+            status_rotation_seconds=60,
+            statuses=["Ready"],
+            wake_word="hey assistant",
+            wake_word_cooldown_seconds=0,
+            reply_in_thread=False,
+        )
+        values.update(discord_overrides)
+        return AppConfig(
+            discord=DiscordConfig(**values),
+            conversation=make_conversation_config(),
+            ollama=OllamaConfig(
+                host="http://localhost",
+                model="test-model",
+                request_timeout=30,
+                stream=True,
+                keep_alive=None,
+            ),
+            stt=STTConfig(model_path="model"),
+            kokoro=KokoroConfig(voice="voice"),
+        )
+
+    return factory
@@ -0,0 +1,98 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import discord
+import pytest
+
+from src import discord_bot
+from src.discord_bot import DiscordAssistantBot
+
+
+@pytest.fixture()
+def create_bot(make_app_config):
+    def factory(guild_ids: list[int]) -> DiscordAssistantBot:
+        return DiscordAssistantBot(make_app_config(guild_ids=guild_ids), MagicMock(), MagicMock())
+
+    return factory
+
+
+class _FakeTree:
+    def __init__(self, commands: list[dict], failing: tuple[int, ...] = ()) -> None:
+        self.commands = commands
+        self.failing = failing
+        self.synced: list[object] = []
+
+    def get_commands(self, *, guild=None):
+        return [SimpleNamespace(to_dict=lambda _tree, payload=payload: payload) for payload in self.commands]
+
+    async def sync(self, *, guild=None):
+        guild_id = getattr(guild, "id", guild)
+        self.synced.append(guild_id)
+        if guild_id in self.failing:
+            raise discord.HTTPException(SimpleNamespace(status=500, reason="Server Error"), "boom")
+        return []
+
+
+def test_sync_skips_guilds_whose_commands_are_unchanged(create_bot, run_async, monkeypatch, tmp_path):
+    monkeypatch.setattr(discord_bot, "_COMMAND_SYNC_CACHE", tmp_path / "command-sync.json")
+
+    tree = _FakeTree([{"name": "ask", "description": "Ask"}])
+    first = create_bot([1, 2])
+    first._command_tree = tree
+    run_async(first._sync_application_commands())
+
+    assert sorted(tree.synced) == [1, 2]
+
+    tree.synced.clear()
+    second = create_bot([1, 2])
+    second._command_tree = tree
+    run_async(second._sync_application_commands())
+
+    assert tree.synced == []
+
+    tree.commands.append({"name": "say", "description": "Say"})
+    third = create_bot([1, 2])
+    third._command_tree = tree
+    run_async(third._sync_application_commands())
+
+    assert sorted(tree.synced) == [1, 2]
+
+
+def test_failed_guild_sync_keeps_the_others_and_is_retried(create_bot, run_async, monkeypatch, tmp_path):
+    monkeypatch.setattr(discord_bot, "_COMMAND_SYNC_CACHE", tmp_path / "command-sync.json")
+
+    tree = _FakeTree([{"name": "ask", "description": "Ask"}], failing=(2,))
+    bot = create_bot([1, 2, 3])
+    bot._command_tree = tree
+    run_async(bot._sync_application_commands())
+
+    assert sorted(tree.synced) == [1, 2, 3]
+    assert bot._commands_synced is False
+
+    tree.synced.clear()
+    tree.failing = ()
+    run_async(bot._sync_application_commands())
+
+    assert tree.synced == [2]
+    assert bot._commands_synced is True
+
+
+def test_sync_is_skipped_on_a_tree_without_sync(create_bot, run_async, monkeypatch, tmp_path):
+    monkeypatch.setattr(discord_bot, "_COMMAND_SYNC_CACHE", tmp_path / "command-sync.json")
+    bot = create_bot([1])
+    bot._command_tree = SimpleNamespace()
+
+    run_async(bot._sync_application_commands())
+
+    assert bot._commands_synced is False
+
+
+def test_guild_scoped_commands_share_one_definition(create_bot):
+    bot = create_bot([1, 2])
+
+    first = {command.name: command for command in bot.tree.get_commands(guild=discord.Object(id=1))}
+    second = {command.name: command for command in bot.tree.get_commands(guild=discord.Object(id=2))}
+
+    assert set(first) == {"reset", "ask", "join", "leave", "say", "stop", "status"}
+    assert all(first[name] is second[name] for name in first)
+    assert bot.tree.get_commands() == []
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import sys
 from pathlib import Path
 from typing import Any
@@ -53,3 +54,62 @@ def test_statuses_are_normalized_and_trimmed(tmp_path: Path) -> None:
     config = load_config(config_path)
 
     assert config.discord.statuses == ["Ready", "Away"]
+
+
+def test_load_config_returns_independent_copies_and_sees_edits(tmp_path: Path) -> None:
+    config_path = _write_config(tmp_path, ["Ready"])
+
+    first = load_config(config_path)
+    first.discord.statuses.append("Mutated")
+    second = load_config(config_path)
+
+    assert second.discord.statuses == ["Ready"]
+
+    content = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    content["discord"]["statuses"] = ["Updated status"]
+    config_path.write_text(yaml.safe_dump(content), encoding="utf-8")
+
+    assert load_config(config_path).discord.statuses == ["Updated status"]
+
+
+def test_empty_sections_fall_back_to_defaults(tmp_path: Path) -> None:
+    config_path = _write_config(tmp_path, ["Ready"])
+    content = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    content["conversation"] = None
+    content["logging"] = None
+    content["ollama"] = {"request_timeout": "30"}
+    config_path.write_text(yaml.safe_dump(content), encoding="utf-8")
+
+    config = load_config(config_path)
+
+    assert config.conversation.history_turns == 12
+    assert config.logging.level == "INFO"
+    assert config.ollama.request_timeout == 30
+
+
+def test_json_configuration_is_supported(tmp_path: Path) -> None:
+    yaml_path = _write_config(tmp_path, ["Ready"])
+    json_path = tmp_path / "config.json"
+    json_path.write_text(
+        json.dumps(yaml.safe_load(yaml_path.read_text(encoding="utf-8"))), encoding="utf-8"
+    )
+
+    config = load_config(json_path)
+
+    assert config.discord.statuses == ["Ready"]
+    assert config.stt.model_path == str(tmp_path / "model")
+
+
+def test_missing_configuration_file_raises(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError, match="Configuration file not found"):
+        load_config(tmp_path / "missing.yaml")
+
+
+def test_shard_ids_require_shard_count(tmp_path: Path) -> None:
+    config_path = _write_config(tmp_path, ["Ready"])
+    content = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    content["discord"]["shard_ids"] = [0]
+    config_path.write_text(yaml.safe_dump(content), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="shard_count"):
+        load_config(config_path)
@@ -0,0 +1,105 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+from src.ai.conversation_manager import ConversationManager
+
+
+def test_cached_reply_is_reused_only_within_the_same_channel(run_async, make_conversation_config):
+    client = AsyncMock()
+    client.generate.side_effect = ["Use !help.", "Ask a moderator."]
+    config = make_conversation_config(history_turns=0, reply_cache_size=8)
+    manager = ConversationManager(config, client)
+
+    first = run_async(manager.generate_reply(1, "How do I get help?"))
+    repeated = run_async(manager.generate_reply(1, "  how do I   get HELP? "))
+    other_channel = run_async(manager.generate_reply(2, "How do I get help?"))
+
+    assert first == repeated == "Use !help."
+    assert other_channel == "Ask a moderator."
+    assert client.generate.await_count == 2
+
+
+def test_reset_drops_the_channels_cached_replies(run_async, make_conversation_config):
+    client = AsyncMock()
+    client.generate.side_effect = ["Old answer", "Fresh answer"]
+    manager = ConversationManager(make_conversation_config(history_turns=0, reply_cache_size=8), client)
+
+    run_async(manager.generate_reply(1, "Question"))
+    run_async(manager.reset(1))
+    reply = run_async(manager.generate_reply(1, "Question"))
+
+    assert reply == "Fresh answer"
+    assert client.generate.await_count == 2
+
+
+def test_cached_reply_is_not_reused_once_the_history_differs(run_async, make_conversation_config):
+    client = AsyncMock()
+    client.generate.side_effect = ["First answer", "Second answer"]
+    manager = ConversationManager(make_conversation_config(reply_cache_size=8), client)
+
+    run_async(manager.generate_reply(1, "What now?"))
+    reply = run_async(manager.generate_reply(1, "What now?"))
+
+    assert reply == "Second answer"
+    assert client.generate.await_count == 2
+
+
+def test_reply_cache_is_disabled_by_default(run_async, make_conversation_config):
+    client = AsyncMock()
+    client.generate.return_value = "Answer"
+    manager = ConversationManager(make_conversation_config(history_turns=0), client)
+
+    run_async(manager.generate_reply(1, "Question"))
+    run_async(manager.generate_reply(1, "Question"))
+
+    assert client.generate.await_count == 2
+
+
+def test_concurrent_requests_in_different_channels_are_not_shared(run_async, make_conversation_config):
+    async def runner():
+        release = asyncio.Event()
+
+        async def generate(messages, **_kwargs):
+            await release.wait()
+            return f"Answer to {messages[-1]['content']}"
+
+        client = AsyncMock()
+        client.generate.side_effect = generate
+        manager = ConversationManager(make_conversation_config(), client)
+
+        first = asyncio.ensure_future(manager.generate_reply(1, "Hello"))
+        second = asyncio.ensure_future(manager.generate_reply(2, "hello"))
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(first, second), client.generate.await_count
+
+    replies, calls = run_async(runner())
+
+    assert replies == ["Answer to Hello", "Answer to hello"]
+    assert calls == 2
+
+
+def test_concurrent_duplicate_in_the_same_channel_shares_one_request(run_async, make_conversation_config):
+    async def runner():
+        release = asyncio.Event()
+
+        async def generate(*_args, **_kwargs):
+            await release.wait()
+            return "Shared answer"
+
+        client = AsyncMock()
+        client.generate.side_effect = generate
+        manager = ConversationManager(make_conversation_config(), client)
+
+        first = asyncio.ensure_future(manager.generate_reply(1, "Hello"))
+        second = asyncio.ensure_future(manager.generate_reply(1, "hello "))
+        await asyncio.sleep(0)
+        release.set()
+        replies = await asyncio.gather(first, second)
+        return replies, client.generate.await_count, list(manager._get_history(1))
+
+    replies, calls, history = run_async(runner())
+
+    assert replies == ["Shared answer", "Shared answer"]
+    assert calls == 1
+    assert history == [("user", "Hello"), ("assistant", "Shared answer")]
@@ -0,0 +1,35 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.discord_bot import DiscordAssistantBot
+
+
+@pytest.fixture()
+def bot(make_app_config) -> DiscordAssistantBot:
+    return DiscordAssistantBot(make_app_config(), MagicMock(), MagicMock())
+
+
+def test_rotate_status_skips_resending_an_unchanged_presence(bot: DiscordAssistantBot, run_async) -> None:
+    bot.change_presence = AsyncMock()
+
+    run_async(bot.rotate_status())
+    run_async(bot.rotate_status())
+
+    bot.change_presence.assert_awaited_once()
+    assert bot.change_presence.await_args.kwargs["activity"].name == "Ready"
+
+
+def test_status_embed_is_a_fresh_copy_each_time(bot: DiscordAssistantBot) -> None:
+    first = bot._build_status_embed()
+    first.add_field(name="Extra", value="changed")
+
+    second = bot._build_status_embed()
+
+    assert second is not first
+    assert [field.name for field in second.fields] == ["Model", "Wake Word", "History Turns", "Status Rotation"]
+
+
+def test_first_status_is_sent_with_every_identify(bot: DiscordAssistantBot) -> None:
+    assert bot.activity is not None
+    assert bot.activity.name == "Ready"
@@ -1,11 +1,15 @@
 import asyncio
+import wave
+from io import BytesIO
 from types import SimpleNamespace
 
 import logging
 
 import discord
+import numpy as np
 import pytest
 
+from src.ai import voice_session as voice_session_module
 from src.ai.voice_session import VoiceSession
 
 
@@ -23,6 +27,16 @@ class _DummyVoiceClient:
         self.channel = channel
 
 
+def _wav_bytes(*, rate: int, channels: int, width: int, frames: bytes) -> bytes:
+    buffer = BytesIO()
+    with wave.open(buffer, "wb") as wav_out:
+        wav_out.setnchannels(channels)
+        wav_out.setsampwidth(width)
+        wav_out.setframerate(rate)
+        wav_out.writeframes(frames)
+    return buffer.getvalue()
+
+
 def test_validate_voice_permissions_raises_when_connect_missing():
     session = VoiceSession(SimpleNamespace(), SimpleNamespace())
 
@@ -176,6 +190,35 @@ def test_diagnose_channel_silence_warns_when_all_members_muted(caplog):
     assert "All non-bot members" in caplog.text
 
 
+def test_diagnose_channel_silence_skips_participant_list_when_info_disabled(caplog):
+    session = VoiceSession(SimpleNamespace(), SimpleNamespace())
+
+    voice_state = SimpleNamespace(
+        self_mute=True,
+        mute=False,
+        self_deaf=False,
+        deaf=False,
+        suppressed=False,
+    )
+    member = SimpleNamespace(
+        id=123,
+        name="Listener",
+        bot=False,
+        voice=voice_state,
+    )
+    channel = SimpleNamespace(
+        members=[member],
+        guild=SimpleNamespace(me=SimpleNamespace(id=999)),
+    )
+    voice_client = SimpleNamespace(channel=channel)
+
+    with caplog.at_level(logging.WARNING):
+        session._diagnose_channel_silence(voice_client)
+
+    assert "Voice participants" not in caplog.text
+    assert "All non-bot members" in caplog.text
+
+
 def test_join_retries_with_fresh_voice_session_when_invalidated(monkeypatch):
     monkeypatch.setattr(discord.voice_client, "has_nacl", True, raising=False)
 
@@ -520,3 +563,214 @@ def test_join_serializes_parallel_connection_attempts(monkeypatch):
     assert first is second
     assert connect_calls == [False]
 
+
+
+@pytest.mark.parametrize("use_soxr", [True, False])
+def test_prepare_transcription_audio_downmixes_and_resamples_discord_audio(monkeypatch, use_soxr):
+    if use_soxr:
+        pytest.importorskip("soxr")
+    else:
+        monkeypatch.setattr(voice_session_module, "soxr", None)
+
+    session = VoiceSession(SimpleNamespace(), SimpleNamespace())
+
+    # 100 ms of 48 kHz stereo int16, the format Discord voice receive produces.
+    payload = _wav_bytes(rate=48000, channels=2, width=2, frames=b"\x10\x00\x30\x00" * 4800)
+
+    samples = session._prepare_transcription_audio(payload)
+
+    assert isinstance(samples, np.ndarray)
+    assert samples.dtype == np.float32
+    assert samples.ndim == 1
+    assert abs(samples.shape[0] - 1600) <= 16
+
+
+def test_resample_fallback_filters_content_above_target_nyquist(monkeypatch):
+    monkeypatch.setattr(voice_session_module, "soxr", None)
+    session = VoiceSession(SimpleNamespace(), SimpleNamespace())
+
+    t = np.arange(4800) / 48000
+    speech_band = (10000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+    above_nyquist = (10000 * np.sin(2 * np.pi * 12000 * t)).astype(np.int16)
+
+    kept = session._resample(speech_band, 48000, 16000)
+    aliased = session._resample(above_nyquist, 48000, 16000)
+
+    assert kept.dtype == np.int16 and kept.shape == (1600,)
+    assert np.abs(kept[50:-50]).max() > 9000
+    assert np.abs(aliased[50:-50]).max() < 500
+
+
+def test_prepare_transcription_audio_widens_unsigned_8bit_audio():
+    session = VoiceSession(SimpleNamespace(), SimpleNamespace())
+
+    # Left channel at full positive swing, right channel silent (128 is the 8-bit midpoint).
+    payload = _wav_bytes(rate=16000, channels=2, width=1, frames=b"\xff\x80" * 160)
+
+    samples = session._prepare_transcription_audio(payload)
+
+    assert np.array_equal(samples, np.full(160, (127 * 256 // 2) / 32768.0, dtype=np.float32))
+
+
+def test_prepare_transcription_audio_skips_resample_for_matching_audio(monkeypatch):
+    session = VoiceSession(SimpleNamespace(), SimpleNamespace())
+    payload = _wav_bytes(rate=16000, channels=1, width=2, frames=b"\x00\x40" * 160)
+
+    def fail_resample(*_args, **_kwargs):  # pragma: no cover - only hit on regression
+        raise AssertionError("already-normalised audio should not be resampled")
+
+    monkeypatch.setattr(session, "_resample", fail_resample)
+
+    samples = session._prepare_transcription_audio(payload)
+
+    assert np.array_equal(samples, np.full(160, 0.5, dtype=np.float32))
+
+
+def test_prepare_transcription_audio_reads_long_wav_in_chunks(monkeypatch):
+    monkeypatch.setattr(VoiceSession, "_WAV_READ_CHUNK_FRAMES", 100)
+    session = VoiceSession(SimpleNamespace(), SimpleNamespace())
+
+    left = np.arange(1050, dtype=np.int16)
+    stereo = np.column_stack((left, left)).astype("<i2").tobytes()
+    payload = _wav_bytes(rate=16000, channels=2, width=2, frames=stereo)
+
+    samples = session._prepare_transcription_audio(payload)
+
+    assert np.array_equal(samples, left.astype(np.float32) / 32768.0)
+
+
+def test_prepare_transcription_audio_accepts_headerless_discord_pcm():
+    session = VoiceSession(SimpleNamespace(), SimpleNamespace())
+
+    # 10 ms of 48 kHz stereo int16 straight from the Opus decoder, no WAV header.
+    pcm = b"\x00\x20\x00\x20" * 480
+
+    samples = session._prepare_transcription_audio(pcm, pcm_format=(48000, 2, 2))
+
+    assert isinstance(samples, np.ndarray)
+    assert abs(samples.shape[0] - 160) <= 2
+
+
+def test_prepare_transcription_audio_falls_back_to_raw_stream_for_invalid_wav():
+    session = VoiceSession(SimpleNamespace(), SimpleNamespace())
+
+    audio = session._prepare_transcription_audio(b"not a wav payload")
+
+    assert isinstance(audio, BytesIO)
+    assert audio.getvalue() == b"not a wav payload"
+
+
+def test_process_sink_normalises_audio_off_the_event_loop():
+    import threading
+
+    transcribed: list[tuple[object, str]] = []
+    normalise_threads: list[threading.Thread] = []
+
+    async def fake_transcribe(audio):
+        assert isinstance(audio, np.ndarray)
+        return "hello"
+
+    session = VoiceSession(SimpleNamespace(transcribe=fake_transcribe), SimpleNamespace())
+    original_prepare = session._prepare_transcription_audio
+
+    def tracking_prepare(audio_bytes, **kwargs):
+        normalise_threads.append(threading.current_thread())
+        return original_prepare(audio_bytes, **kwargs)
+
+    session._prepare_transcription_audio = tracking_prepare  # type: ignore[assignment]
+
+    payload = _wav_bytes(rate=16000, channels=1, width=2, frames=b"\x00\x00" * 160)
+    sink_file = BytesIO(payload)
+    sink = SimpleNamespace(audio_data={"user": SimpleNamespace(file=sink_file, start_time=0.0)})
+
+    async def on_transcription(user, transcript):
+        transcribed.append((user, transcript))
+
+    _EVENT_LOOP.run_until_complete(session._process_sink(sink, on_transcription))
+
+    assert transcribed == [("user", "hello")]
+    assert normalise_threads and normalise_threads[0] is not threading.main_thread()
+    # The sink buffer must not stay pinned by an exported view once processing is done.
+    sink_file.close()
+
+
+def test_speak_plays_in_memory_pcm_without_ffmpeg(monkeypatch):
+    async def fake_synthesize_pcm(text):
+        assert text == "hello"
+        return np.full(240, 1000, dtype=np.int16)
+
+    tts = SimpleNamespace(synthesize_pcm=fake_synthesize_pcm, sample_rate=24000)
+    session = VoiceSession(SimpleNamespace(), tts)
+
+    def fail_ffmpeg(*_args, **_kwargs):  # pragma: no cover - only hit on regression
+        raise AssertionError("speech playback should not spawn FFmpeg")
+
+    monkeypatch.setattr(discord, "FFmpegPCMAudio", fail_ffmpeg)
+
+    played: list[object] = []
+    voice_client = SimpleNamespace(
+        is_playing=lambda: False,
+        play=lambda source, after=None: played.append(source),
+    )
+
+    _EVENT_LOOP.run_until_complete(session.speak(voice_client, "hello"))
+
+    assert len(played) == 1
+    source = played[0]
+    assert isinstance(source, discord.PCMAudio)
+    frame = source.read()
+    assert len(frame) == discord.opus.Encoder.FRAME_SIZE
+    assert source.read() == b""
+
+
+def test_process_sink_overlaps_transcriptions_but_preserves_speaking_order():
+    started: list[float] = []
+    delivered: list[str] = []
+
+    async def fake_transcribe(audio):
+        value = float(audio[0])
+        started.append(value)
+        # The earlier speaker's transcription finishes last.
+        await asyncio.sleep(0.05 if value > 0 else 0.0)
+        return "first" if value > 0 else "second"
+
+    session = VoiceSession(SimpleNamespace(transcribe=fake_transcribe), SimpleNamespace())
+    first = _wav_bytes(rate=16000, channels=1, width=2, frames=b"\x00\x40" * 160)
+    second = _wav_bytes(rate=16000, channels=1, width=2, frames=b"\x00\x00" * 160)
+    sink = SimpleNamespace(
+        audio_data={
+            "b": SimpleNamespace(file=BytesIO(second), start_time=2.0),
+            "a": SimpleNamespace(file=BytesIO(first), start_time=1.0),
+        }
+    )
+
+    async def on_transcription(user, transcript):
+        assert len(started) == 2
+        delivered.append(f"{user}:{transcript}")
+
+    _EVENT_LOOP.run_until_complete(session._process_sink(sink, on_transcription))
+
+    assert delivered == ["a:first", "b:second"]
+
+
+def test_ensure_voice_reception_remembers_unsupported_voice_state_flags():
+    session = VoiceSession(SimpleNamespace(), SimpleNamespace())
+    calls: list[dict[str, object]] = []
+
+    def change_voice_state(*, channel):
+        calls.append({"channel": channel})
+
+    channel = SimpleNamespace(id=1)
+    guild = SimpleNamespace(change_voice_state=change_voice_state, me=SimpleNamespace(voice=None))
+    voice_client = SimpleNamespace(guild=guild, channel=channel, self_deaf=False, self_mute=False)
+
+    async def ready(_voice_client):
+        return None
+
+    session._wait_until_voice_ready = ready  # type: ignore[assignment]
+
+    _EVENT_LOOP.run_until_complete(session._ensure_voice_reception(voice_client))
+    _EVENT_LOOP.run_until_complete(session._ensure_voice_reception(voice_client))
+
+    assert calls == [{"channel": channel}, {"channel": channel}]
+    assert session._voice_state_flags_supported is False
@@ -1,8 +1,9 @@
 import asyncio
 import time
 from types import SimpleNamespace
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
+import discord
 import pytest
 
 from src.config import (
@@ -120,3 +121,54 @@ def test_voice_stop_command_without_state(bot: DiscordAssistantBot) -> None:
     asyncio.run(bot._handle_transcription(voice_client, MagicMock(), "stop"))
 
     bot.voice_session.stop_speaking.assert_called_once_with(voice_client)
+
+
+@pytest.mark.parametrize(
+    ("transcript", "expected"),
+    [
+        ("Stop talking please", True),
+        ("could you be quiet", True),
+        ("shut   up", True),
+        ("silence!", True),
+        ("unstoppable momentum", False),
+        ("quietly continue", False),
+    ],
+)
+def test_voice_stop_request_phrases(bot: DiscordAssistantBot, transcript: str, expected: bool) -> None:
+    assert bot._is_voice_stop_request(transcript) is expected
+
+
+def test_failed_followup_is_not_retried_before_channel_fallback(bot: DiscordAssistantBot, run_async) -> None:
+    interaction = SimpleNamespace(
+        response=SimpleNamespace(is_done=lambda: True, send_message=AsyncMock()),
+        followup=SimpleNamespace(
+            send=AsyncMock(side_effect=discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "gone"))
+        ),
+        channel=SimpleNamespace(send=AsyncMock()),
+    )
+
+    run_async(bot._send_interaction_message(interaction, "Hello", prefer_followup=True))
+
+    assert interaction.followup.send.await_count == 1
+    interaction.response.send_message.assert_not_awaited()
+    interaction.channel.send.assert_awaited_once_with(content="Hello")
+
+
+def test_interaction_reply_is_split_and_never_mentions(bot: DiscordAssistantBot, run_async) -> None:
+    interaction = SimpleNamespace(
+        response=SimpleNamespace(is_done=lambda: True, send_message=AsyncMock()),
+        followup=SimpleNamespace(send=AsyncMock()),
+        channel=SimpleNamespace(send=AsyncMock()),
+    )
+    reply = "@everyone " + ("word " * 500).strip()
+
+    run_async(bot._send_interaction_reply(interaction, reply))
+
+    calls = interaction.followup.send.await_args_list
+    sent = [call.kwargs["content"] for call in calls]
+    assert len(sent) > 1
+    assert all(len(chunk) <= 2000 for chunk in sent)
+    assert " ".join(sent) == reply
+    assert all(
+        call.kwargs["allowed_mentions"].to_dict() == discord.AllowedMentions.none().to_dict() for call in calls
+    )
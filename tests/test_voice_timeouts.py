@@ -1,6 +1,8 @@
 import asyncio
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from discord.ext import commands
 
 from src.config import (
     AppConfig,
@@ -113,3 +115,51 @@ def test_disconnects_after_idle_timeout() -> None:
         voice_client.disconnect.assert_awaited()
 
     asyncio.run(runner())
+
+
+def test_close_cancels_pending_voice_timers() -> None:
+    async def runner() -> None:
+        bot = create_bot()
+
+        channel = SimpleNamespace(id=700, name="Closing Channel", members=[SimpleNamespace(id=42)])
+        voice_client = MagicMock()
+        voice_client.channel = channel
+        voice_client.disconnect = AsyncMock()
+
+        bot._voice_states[channel.id] = WakeConversationState(voice_client=voice_client, text_channel_id=None)
+        bot._mark_voice_activity(channel.id)
+        idle_task = bot._voice_states[channel.id].idle_disconnect_task
+
+        # The sharded client's own close needs the gateway queue created at login.
+        with patch.object(commands.AutoShardedBot, "close", AsyncMock()):
+            await bot.close()
+
+        assert idle_task is not None and idle_task.cancelled()
+        assert bot._voice_states == {}
+        voice_client.disconnect.assert_not_awaited()
+
+    asyncio.run(runner())
+
+
+def test_inactivity_timer_is_extended_without_new_tasks() -> None:
+    async def runner() -> None:
+        bot = create_bot()
+        bot._finalize_conversation = AsyncMock()
+
+        channel = SimpleNamespace(id=800, name="Chatty Channel", members=[])
+        voice_client = MagicMock()
+        voice_client.channel = channel
+        bot._voice_states[channel.id] = WakeConversationState(voice_client=voice_client, text_channel_id=None)
+
+        bot._set_inactivity_timer(channel.id, delay=0.2)
+        task = bot._voice_states[channel.id].inactivity_task
+        await asyncio.sleep(0.1)
+        bot._set_inactivity_timer(channel.id, delay=0.2)
+
+        assert bot._voice_states[channel.id].inactivity_task is task
+        await asyncio.sleep(0.15)
+        bot._finalize_conversation.assert_not_awaited()
+        await asyncio.sleep(0.1)
+        bot._finalize_conversation.assert_awaited_once_with(channel.id, "silence")
+
+    asyncio.run(runner())
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
+import discord
 import pytest
 
 import sys
@@ -96,3 +98,148 @@ def test_wake_word_removal_preserves_remaining_text(bot: DiscordAssistantBot) ->
 def test_wake_word_allows_punctuation_in_configuration() -> None:
     bot_with_commas = create_bot_with_wake_word("hey, assistant")
     assert bot_with_commas._wake_word_regex.search("hey assistant can you hear me")
+
+
+def test_find_wake_word_rejects_messages_without_the_phrase(bot: DiscordAssistantBot) -> None:
+    assert bot._find_wake_word("just chatting about assistants") is None
+    assert bot._find_wake_word("nothing to see here") is None
+
+
+def test_find_wake_word_matches_regardless_of_case(bot: DiscordAssistantBot) -> None:
+    match = bot._find_wake_word("well HEY, Assistant what time is it")
+
+    assert match is not None
+    assert match.group(0).lower().startswith("hey")
+
+
+def _message(content: str = "hey assistant hello", **overrides) -> SimpleNamespace:
+    values = dict(
+        author=SimpleNamespace(bot=False),
+        webhook_id=None,
+        type=discord.MessageType.default,
+        content=content,
+        channel=SimpleNamespace(id=1),
+        guild=None,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_on_message_ignores_webhook_and_system_messages(bot: DiscordAssistantBot, run_async) -> None:
+    bot.process_commands = AsyncMock()
+
+    run_async(bot.on_message(_message("hey assistant hi", webhook_id=1)))
+    run_async(bot.on_message(_message("hey assistant hi", type=discord.MessageType.pins_add)))
+
+    bot.process_commands.assert_not_awaited()
+
+
+def test_wake_cooldowns_only_keep_channels_still_cooling_down(
+    bot: DiscordAssistantBot, run_async, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    bot.config_data.discord.wake_word_cooldown_seconds = 10
+    bot.process_commands = AsyncMock()
+    bot.conversation_manager.generate_reply = AsyncMock(return_value="Hi!")
+    bot._send_reply = AsyncMock()
+    clock = [1000.0]
+    monkeypatch.setattr("src.discord_bot.time.monotonic", lambda: clock[0])
+
+    for channel_id in range(50):
+        run_async(bot.on_message(_message(channel=SimpleNamespace(id=channel_id))))
+        clock[0] += 1.0
+    run_async(bot.on_message(_message(channel=SimpleNamespace(id=49))))
+
+    assert len(bot._wake_cooldowns) <= 12
+    assert bot.conversation_manager.generate_reply.await_count == 50
+
+
+def test_on_message_only_runs_the_command_parser_for_prefixed_messages(
+    bot: DiscordAssistantBot, run_async
+) -> None:
+    bot.process_commands = AsyncMock()
+
+    run_async(bot.on_message(_message("just chatting")))
+    run_async(bot.on_message(_message("!status")))
+
+    bot.process_commands.assert_awaited_once()
+
+
+def test_send_reply_splits_long_replies_without_mentions(bot: DiscordAssistantBot, run_async) -> None:
+    message = SimpleNamespace(
+        id=1,
+        channel=SimpleNamespace(id=1, send=AsyncMock()),
+        reply=AsyncMock(),
+    )
+    reply = ("word " * 500).strip()
+
+    run_async(bot._send_reply(message, reply))
+
+    first = message.reply.await_args
+    rest = message.channel.send.await_args_list
+    sent = [first.args[0]] + [call.args[0] for call in rest]
+    assert all(len(chunk) <= 2000 for chunk in sent)
+    assert " ".join(sent) == reply
+    assert first.kwargs["allowed_mentions"].to_dict() == discord.AllowedMentions.none().to_dict()
+
+
+def test_on_message_skips_generation_without_send_permission(bot: DiscordAssistantBot, run_async) -> None:
+    bot.conversation_manager.generate_reply = AsyncMock(return_value="Hi!")
+    bot._send_reply = AsyncMock()
+    permissions = SimpleNamespace(send_messages=False, send_messages_in_threads=False)
+    message = _message(
+        channel=SimpleNamespace(id=5, permissions_for=lambda _member: permissions),
+        guild=SimpleNamespace(me=SimpleNamespace(id=99), voice_client=None),
+    )
+
+    run_async(bot.on_message(message))
+
+    bot.conversation_manager.generate_reply.assert_not_awaited()
+    bot._send_reply.assert_not_awaited()
+
+
+def test_on_message_still_speaks_without_send_permission(bot: DiscordAssistantBot, run_async) -> None:
+    bot.conversation_manager.generate_reply = AsyncMock(return_value="Hi!")
+    bot._send_reply = AsyncMock()
+    bot._speak_reply = AsyncMock()
+    permissions = SimpleNamespace(send_messages=False, send_messages_in_threads=False)
+    voice_client = SimpleNamespace(channel=None)
+    message = _message(
+        channel=SimpleNamespace(id=5, permissions_for=lambda _member: permissions),
+        guild=SimpleNamespace(me=SimpleNamespace(id=99), voice_client=voice_client),
+    )
+
+    run_async(bot.on_message(message))
+
+    bot.conversation_manager.generate_reply.assert_awaited_once_with(5, "hello")
+    bot._speak_reply.assert_awaited_once_with(voice_client, "Hi!")
+    bot._send_reply.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    ("create_public_threads", "expected_calls"),
+    [(True, 1), (False, 0)],
+)
+def test_thread_mode_checks_thread_permissions_instead_of_send_messages(
+    bot: DiscordAssistantBot, run_async, create_public_threads: bool, expected_calls: int
+) -> None:
+    bot.config_data.discord.reply_in_thread = True
+    bot.conversation_manager.generate_reply = AsyncMock(return_value="Hi!")
+    bot._send_reply = AsyncMock()
+    permissions = SimpleNamespace(
+        send_messages=False,
+        send_messages_in_threads=True,
+        create_public_threads=create_public_threads,
+    )
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.id = 5
+    channel.permissions_for.return_value = permissions
+    message = _message(
+        channel=channel,
+        thread=None,
+        guild=SimpleNamespace(me=SimpleNamespace(id=99), voice_client=None),
+    )
+
+    run_async(bot.on_message(message))
+
+    assert bot.conversation_manager.generate_reply.await_count == expected_calls
+    assert bot._send_reply.await_count == expected_calls